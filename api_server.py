@@ -1,15 +1,37 @@
 """
 FastAPI Server for Model Serving
 Example API endpoint for model inference
+
+Production:
+    gunicorn -c gunicorn.conf.py api_server:app
+
+Development:
+    python api_server.py
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, List, Any
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import Response
+from typing import Dict, List, Any, Callable, Optional, Tuple
+import msgspec
+import numpy as np
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram,
+    generate_latest, multiprocess
+)
 import pandas as pd
+import asyncio
+from contextlib import asynccontextmanager
 import logging
+import operator
+import os
 import time
 
+# Optional: ONNX Runtime for serving exported (and int8-quantized) models
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -19,81 +41,391 @@ app = FastAPI(title="AI Model Serving API", version="1.0.0")
 # For demo, we'll use a placeholder
 MODEL = None
 
+# Optional local model artifact (.onnx or joblib/pickle), loaded at startup
+MODEL_PATH = os.environ.get("MODEL_PATH", "")
+
+# Micro-batching: concurrent /predict calls arriving within BATCH_WAIT_MS
+# are coalesced into a single vectorized model call of up to BATCH_MAX rows
+BATCH_MAX = int(os.environ.get("BATCH_MAX", "16"))
+BATCH_WAIT_MS = float(os.environ.get("BATCH_WAIT_MS", "5"))
+
+_batch_queue: Optional[asyncio.Queue] = None
+_batch_task: Optional[asyncio.Task] = None
+
+# Admission control: at most PREDICT_CONCURRENCY requests are being scored at
+# once and at most PREDICT_QUEUE_MAX wait for a slot; beyond that /predict
+# sheds load with 503 instead of letting every request's latency grow
+PREDICT_CONCURRENCY = int(os.environ.get("PREDICT_CONCURRENCY", str(BATCH_MAX)))
+PREDICT_QUEUE_MAX = int(os.environ.get("PREDICT_QUEUE_MAX", "128"))
+
+_inflight: Optional[asyncio.Semaphore] = None
+_waiting = 0
+
+# Prometheus metrics; latency is split into time spent waiting in the batch
+# queue and time spent in the model call
+_LATENCY_BUCKETS = (.001, .005, .01, .025, .05, .1, .25, .5, 1, 2.5)
+
+PREDICT_REQUESTS = Counter(
+    "predict_requests_total", "Prediction requests by outcome", ["outcome"]
+)
+PREDICT_LATENCY = Histogram(
+    "predict_latency_seconds", "End-to-end /predict latency", buckets=_LATENCY_BUCKETS
+)
+PREDICT_QUEUE_TIME = Histogram(
+    "predict_queue_seconds", "Time a request waits for its batch", buckets=_LATENCY_BUCKETS
+)
+PREDICT_INFERENCE_TIME = Histogram(
+    "predict_inference_seconds", "Model call duration per batch", buckets=_LATENCY_BUCKETS
+)
+PREDICT_BATCH_SIZE = Histogram(
+    "predict_batch_size", "Rows per model call", buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+# Feature schema cached at model-load time, so the hot path fills a
+# preallocated ndarray instead of building a DataFrame for every batch
+FEATURE_NAMES: Optional[List[str]] = None
+FEATURE_DTYPE = np.float32
+_BUF: Optional[np.ndarray] = None
+_row_values: Optional[Callable[[Dict[str, Any]], tuple]] = None
 
-class PredictionRequest(BaseModel):
+
+# Request and response bodies are msgspec Structs: requests are decoded and
+# validated in one pass, responses are encoded straight to bytes, and neither
+# goes through FastAPI's Pydantic pipeline
+class PredictionRequest(msgspec.Struct):
     features: Dict[str, Any]
 
 
-class PredictionResponse(BaseModel):
+class PredictionResponse(msgspec.Struct):
     prediction: int
     probability: List[float]
     latency_ms: float
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(msgspec.Struct):
     status: str
     version: str
 
 
+class OnnxModel:
+    """
+    sklearn-style predict/predict_proba over an ONNX Runtime session
+    
+    Expects a classifier exported with skl2onnx (label output followed by
+    probabilities). If a quantized sibling (model.int8.onnx, produced by
+    onnxruntime.quantization.quantize_dynamic) exists it is loaded instead.
+    Feature order comes from the model's 'feature_names' metadata entry or
+    the MODEL_FEATURES env var (comma-separated); the graph takes its input
+    by position, so loading fails when neither is set.
+    """
+    
+    def __init__(self, path: str):
+        quantized = path[:-len(".onnx")] + ".int8.onnx"
+        if os.path.exists(quantized):
+            path = quantized
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # Gunicorn already runs one worker per core (see gunicorn.conf.py)
+        options.intra_op_num_threads = int(os.environ.get("OMP_NUM_THREADS", "0"))
+        
+        self.session = ort.InferenceSession(
+            path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.path = path
+        self._input = self.session.get_inputs()[0].name
+        
+        meta = self.session.get_modelmeta().custom_metadata_map
+        names = meta.get("feature_names") or os.environ.get("MODEL_FEATURES", "")
+        if not names:
+            raise ValueError(
+                f"{path} has no 'feature_names' metadata; set MODEL_FEATURES "
+                "to the model's input column order"
+            )
+        self.feature_names_in_ = [n.strip() for n in names.split(",")]
+    
+    def _run(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        labels, probabilities = self.session.run(None, {self._input: X})[:2]
+        if isinstance(probabilities, list):
+            # ZipMap output: one {class: probability} dict per row
+            probabilities = np.array([[row[k] for k in sorted(row)] for row in probabilities])
+        return labels, probabilities
+    
+    def predict_with_proba(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and probabilities from a single session run"""
+        return self._run(X)
+    
+    def predict(self, X) -> np.ndarray:
+        return self._run(X)[0]
+    
+    def predict_proba(self, X) -> np.ndarray:
+        return self._run(X)[1]
+
+
+def load_model(path: str):
+    """Load a model artifact from disk"""
+    if path.endswith(".onnx"):
+        if ort is None:
+            raise RuntimeError("onnxruntime is required to serve .onnx models")
+        return OnnxModel(path)
+    
+    import joblib
+    return joblib.load(path)
+
+
+_json_encoder = msgspec.json.Encoder()
+_prediction_decoder = msgspec.json.Decoder(PredictionRequest)
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response encoded by msgspec, bypassing FastAPI's jsonable_encoder"""
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return _json_encoder.encode(content)
+
+
+def _openapi_response(struct_type: type) -> Dict[int, Dict[str, Any]]:
+    """Document a Struct response in OpenAPI without a Pydantic response_model"""
+    schema = msgspec.json.schema(struct_type)["$defs"][struct_type.__name__]
+    return {200: {"content": {"application/json": {"schema": schema}}}}
+
+
+def _openapi_body(struct_type: type) -> Dict[str, Any]:
+    """Document a Struct request body in OpenAPI when it is parsed by a dependency"""
+    schema = msgspec.json.schema(struct_type)["$defs"][struct_type.__name__]
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
+async def parse_prediction_request(request: Request) -> PredictionRequest:
+    """Decode and validate the /predict body with msgspec"""
+    try:
+        return _prediction_decoder.decode(await request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+
+
+def _cache_feature_schema():
+    """Cache the model's feature order and preallocate the input buffer"""
+    global FEATURE_NAMES, _BUF, _row_values
+    names = getattr(MODEL, "feature_names_in_", None)
+    if names is None:
+        # Unknown schema - fall back to DataFrame construction per batch
+        FEATURE_NAMES = None
+        _BUF = None
+        _row_values = None
+        return
+    
+    FEATURE_NAMES = list(names)
+    _BUF = np.empty((BATCH_MAX, len(FEATURE_NAMES)), dtype=FEATURE_DTYPE)
+    
+    # itemgetter does every dict lookup for a row in one C call
+    getter = operator.itemgetter(*FEATURE_NAMES)
+    _row_values = getter if len(FEATURE_NAMES) > 1 else (lambda features: (getter(features),))
+    logger.info(f"Cached feature schema ({len(FEATURE_NAMES)} features)")
+
+
+def _to_matrix(batch: List[Dict[str, Any]]) -> np.ndarray:
+    """Fill the preallocated buffer in the cached feature order"""
+    out = _BUF[:len(batch)]
+    try:
+        # One bulk assignment converts and casts the whole batch in NumPy
+        out[:] = [_row_values(features) for features in batch]
+    except KeyError as e:
+        raise ValueError(f"Missing feature: {e.args[0]}") from None
+    return out
+
+
+def _predict_batch(batch: List[Dict[str, Any]]) -> List[Tuple[int, List[float]]]:
+    """Run one model call for a batch of feature dicts"""
+    if MODEL is None:
+        # Demo prediction
+        return [(1, [0.3, 0.7]) for _ in batch]
+    
+    if FEATURE_NAMES is not None:
+        # Named columns over the buffer (no copy) satisfy sklearn's feature-name check
+        X = pd.DataFrame(_to_matrix(batch), columns=FEATURE_NAMES, copy=False)
+    else:
+        X = pd.DataFrame(batch)
+    if hasattr(MODEL, "predict_with_proba"):
+        predictions, probabilities = MODEL.predict_with_proba(X)
+    else:
+        predictions = MODEL.predict(X)
+        probabilities = MODEL.predict_proba(X)
+    return [
+        (int(prediction), probability.tolist())
+        for prediction, probability in zip(predictions, probabilities)
+    ]
+
+
+async def _run_batch(batch: List[Tuple[Dict[str, Any], asyncio.Future, int]]):
+    """Score a batch off the event loop and resolve each waiting request"""
+    loop = asyncio.get_running_loop()
+    features = [item[0] for item in batch]
+    
+    dispatch_ns = time.perf_counter_ns()
+    try:
+        results = await loop.run_in_executor(None, _predict_batch, features)
+    except Exception as e:
+        if len(batch) == 1:
+            if not batch[0][1].done():
+                batch[0][1].set_exception(e)
+            return
+        # One malformed request must not fail its batch-mates: retry row by row
+        for item in batch:
+            await _run_batch([item])
+        return
+    
+    PREDICT_INFERENCE_TIME.observe((time.perf_counter_ns() - dispatch_ns) / 1e9)
+    PREDICT_BATCH_SIZE.observe(len(batch))
+    
+    for (_, future, enqueued_ns), result in zip(batch, results):
+        PREDICT_QUEUE_TIME.observe((dispatch_ns - enqueued_ns) / 1e9)
+        if not future.done():
+            future.set_result(result)
+
+
+@asynccontextmanager
+async def _admit():
+    """Hold a /predict slot, or fail fast with 503 when the wait queue is full"""
+    global _waiting
+    if _inflight.locked() and _waiting >= PREDICT_QUEUE_MAX:
+        PREDICT_REQUESTS.labels(outcome="rejected").inc()
+        raise HTTPException(
+            status_code=503,
+            detail="Server overloaded, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    
+    _waiting += 1
+    try:
+        await _inflight.acquire()
+    finally:
+        _waiting -= 1
+    try:
+        yield
+    finally:
+        _inflight.release()
+
+
+async def _batch_worker():
+    """Drain the request queue into batches of up to BATCH_MAX rows"""
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = loop.time() + BATCH_WAIT_MS / 1000
+        
+        while len(batch) < BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # Skip requests whose clients have already gone away
+        batch = [item for item in batch if not item[1].done()]
+        if batch:
+            await _run_batch(batch)
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Load model on startup"""
-    global MODEL
+    """Load model and start the micro-batching worker on startup"""
+    global MODEL, _batch_queue, _batch_task, _inflight
     logger.info("Loading model...")
     # In production: load from MLflow or model registry
     # MODEL = load_model_from_registry()
+    if MODEL_PATH:
+        MODEL = load_model(MODEL_PATH)
+        logger.info(f"Loaded {getattr(MODEL, 'path', MODEL_PATH)}")
     logger.info("Model loaded")
+    _cache_feature_schema()
+    
+    _inflight = asyncio.Semaphore(PREDICT_CONCURRENCY)
+    _batch_queue = asyncio.Queue()
+    _batch_task = asyncio.create_task(_batch_worker())
+    logger.info(f"Micro-batching enabled (max={BATCH_MAX}, wait={BATCH_WAIT_MS}ms)")
+    logger.info(f"Admission control: {PREDICT_CONCURRENCY} in flight, {PREDICT_QUEUE_MAX} queued")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the micro-batching worker"""
+    if _batch_task is not None:
+        _batch_task.cancel()
 
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", response_class=MsgspecJSONResponse,
+         responses=_openapi_response(HealthResponse))
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(status="healthy", version="1.0.0")
+    return MsgspecJSONResponse(HealthResponse(status="healthy", version="1.0.0"))
 
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict(request: PredictionRequest):
+@app.post("/predict", response_class=MsgspecJSONResponse,
+          responses=_openapi_response(PredictionResponse),
+          openapi_extra=_openapi_body(PredictionRequest))
+async def predict(request: PredictionRequest = Depends(parse_prediction_request)):
     """Make prediction"""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        # Convert to DataFrame
-        df = pd.DataFrame([request.features])
+        async with _admit():
+            # Queue for the batch worker, which scores it with its batch-mates
+            future = asyncio.get_running_loop().create_future()
+            await _batch_queue.put((request.features, future, time.perf_counter_ns()))
+            prediction, probability = await future
         
-        # Make prediction (placeholder - replace with actual model)
-        if MODEL is None:
-            # Demo prediction
-            prediction = 1
-            probability = [0.3, 0.7]
-        else:
-            prediction = MODEL.predict(df)[0]
-            probability = MODEL.predict_proba(df)[0].tolist()
+        latency_ns = time.perf_counter_ns() - start_ns
+        PREDICT_LATENCY.observe(latency_ns / 1e9)
+        PREDICT_REQUESTS.labels(outcome="ok").inc()
         
-        latency = (time.time() - start_time) * 1000
-        
-        return PredictionResponse(
+        return MsgspecJSONResponse(PredictionResponse(
             prediction=int(prediction),
             probability=probability,
-            latency_ms=latency
-        )
+            latency_ms=latency_ns / 1_000_000
+        ))
     
+    except HTTPException:
+        raise
     except Exception as e:
+        PREDICT_REQUESTS.labels(outcome="error").inc()
         logger.error(f"Prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _metrics_registry() -> CollectorRegistry:
+    """Registry to expose; aggregates all Gunicorn workers in multiprocess mode"""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+_METRICS_REGISTRY = _metrics_registry()
+
+
 @app.get("/metrics")
 async def get_metrics():
-    """Get serving metrics"""
-    # In production, return actual metrics from monitoring system
-    return {
-        "total_requests": 0,
-        "avg_latency_ms": 0,
-        "error_rate": 0
-    }
+    """Get serving metrics in Prometheus exposition format"""
+    return Response(generate_latest(_METRICS_REGISTRY), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
+    # Single-process dev server; production runs under Gunicorn (see gunicorn.conf.py)
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app, host="0.0.0.0", port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # no uvloop on Windows
+        http="httptools",
+        access_log=False
+    )
 
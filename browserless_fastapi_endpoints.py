@@ -12,20 +12,28 @@ Usage:
 """
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
+import asyncio
 import base64
 import os
 from datetime import datetime
 
 # Import the browserless integration
 try:
-    from browserless_integration import UnifiedScraperService, get_scraper_service
+    from browserless_integration import (
+        UnifiedScraperService, get_scraper_service, TTLCache, make_cache_key, SourceRecord
+    )
 except ImportError:
     print("⚠️  browserless_integration.py not found. Make sure it's in the same directory.")
     UnifiedScraperService = None
     get_scraper_service = None
+    TTLCache = None
+    make_cache_key = None
+    SourceRecord = Dict
 
 
 # ============================================
@@ -81,22 +89,23 @@ class ClosedClinicsRequest(BaseModel):
 class JobSearchResponse(BaseModel):
     """Job search response"""
     status: str
-    data: Dict[str, List[Dict]]
+    data: Dict[str, List[SourceRecord]]
     total: int
-    timestamp: str
+    timestamp: datetime
 
 class PropertySearchResponse(BaseModel):
     """Property search response"""
     status: str
     data: Dict
-    timestamp: str
+    timestamp: datetime
 
 class ScreenshotResponse(BaseModel):
     """Screenshot response"""
     status: str
     image: str  # Base64 encoded
     content_type: str
-    timestamp: str
+    size_bytes: int
+    timestamp: datetime
 
 
 # ============================================
@@ -119,6 +128,124 @@ def get_service() -> UnifiedScraperService:
     return _scraper_service
 
 
+# ============================================
+# RESPONSE CACHE
+# ============================================
+
+# Scrape results are stable for minutes, so repeat calls within the TTL are
+# served from memory instead of triggering another multi-second Browserless run
+SCRAPE_CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', '300'))
+
+_response_cache = TTLCache(maxsize=512, ttl=SCRAPE_CACHE_TTL) if TTLCache else None
+
+# Lets browsers and upstream CDNs reuse cached scrape responses too
+CACHE_HEADERS = {'Cache-Control': f'max-age={SCRAPE_CACHE_TTL}'}
+
+# Scrapes currently running, by cache key; identical requests arriving before
+# the first one finishes await its task instead of starting another scrape
+_inflight_scrapes: Dict[bytes, asyncio.Future] = {}
+
+
+def _has_results(results) -> bool:
+    """Only cache runs that found something, so transient failures are retried"""
+    if isinstance(results, dict):
+        return 'error' not in results and any(results.values())
+    return bool(results)
+
+
+async def _scrape_and_cache(key, scrape, args, kwargs):
+    """Run one scrape for every caller waiting on key, then cache the result"""
+    try:
+        results = await scrape(*args, **kwargs)
+        if _has_results(results):
+            _response_cache.set(key, results)
+        return results
+    finally:
+        _inflight_scrapes.pop(key, None)
+
+
+async def _cached_scrape(key, scrape, *args, **kwargs):
+    """Return a cached scrape result, or await scrape(...) and cache it"""
+    results = _response_cache.get(key)
+    if results is not None:
+        return results
+    
+    # No await between lookup and insert, so this is race-free on the event loop
+    task = _inflight_scrapes.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_scrape_and_cache(key, scrape, args, kwargs))
+        _inflight_scrapes[key] = task
+    
+    # Shielded so one caller disconnecting doesn't cancel the others' scrape
+    return await asyncio.shield(task)
+
+
+def _jobs_cache_key(keywords: str, location: str, sources: List[str], remote_only: bool = False) -> bytes:
+    """Cache key for a job search; source order and case don't matter"""
+    return make_cache_key('jobs', keywords.strip().lower(), location.strip().lower(),
+                          sorted(sources), remote_only)
+
+
+def _instagram_cache_key(username: str) -> bytes:
+    """Cache key for a profile: the normalized username"""
+    return make_cache_key('instagram', username.replace('@', '').strip().lower())
+
+
+def _clinics_cache_key(cities: List[str], state: str) -> bytes:
+    """Cache key for a closed-clinics search; city order doesn't matter"""
+    return make_cache_key('closed_clinics', sorted(c.strip().lower() for c in cities), state.upper())
+
+
+# ============================================
+# BINARY RESPONSE HELPERS
+# ============================================
+
+# Screenshots/PDFs are relayed from Browserless in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Largest screenshot returned base64-encoded inside JSON; bigger images
+# must use /api/scrape/screenshot/raw
+MAX_INLINE_SCREENSHOT_BYTES = 256 * 1024
+
+
+def _stream_upstream(upstream, media_type: str, filename: str) -> StreamingResponse:
+    """Relay an open Browserless response without buffering the body"""
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    # aiter_bytes() yields decoded bytes, so a compressed body's length
+    # would not match what is sent
+    if 'content-length' in upstream.headers and 'content-encoding' not in upstream.headers:
+        headers['Content-Length'] = upstream.headers['content-length']
+    
+    return StreamingResponse(
+        upstream.aiter_bytes(STREAM_CHUNK_SIZE),
+        media_type=media_type,
+        headers=headers,
+        background=BackgroundTask(upstream.aclose)
+    )
+
+
+async def _read_capped(upstream, limit: int) -> bytes:
+    """Read an open Browserless response, refusing bodies over limit bytes"""
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Screenshot exceeds {limit // 1024} KB; use /api/scrape/screenshot/raw instead"
+    )
+    try:
+        # Content-Length of a compressed body is not the decoded size
+        if ('content-encoding' not in upstream.headers
+                and int(upstream.headers.get('content-length', 0)) > limit):
+            raise too_large
+        
+        body = bytearray()
+        async for chunk in upstream.aiter_bytes(STREAM_CHUNK_SIZE):
+            body += chunk
+            if len(body) > limit:
+                raise too_large
+        return bytes(body)
+    finally:
+        await upstream.aclose()
+
+
 # ============================================
 # ROUTE REGISTRATION
 # ============================================
@@ -132,11 +259,18 @@ def register_browserless_routes(app: FastAPI):
         register_browserless_routes(app)
     """
     
+    @app.on_event("shutdown")
+    async def close_browserless_client():
+        """Close the scraper service's pooled Browserless connections"""
+        if _scraper_service is not None:
+            await _scraper_service.aclose()
+    
     # ============================================
     # JOB SCRAPING ENDPOINTS
     # ============================================
     
-    @app.post("/api/scrape/jobs", response_model=JobSearchResponse, tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/jobs", responses={200: {"model": JobSearchResponse}}, tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def scrape_jobs(request: JobSearchRequest):
         """
         Scrape jobs from multiple platforms using Browserless.io
@@ -150,60 +284,69 @@ def register_browserless_routes(app: FastAPI):
         """
         try:
             service = get_service()
-            results = service.scrape_jobs(
+            results = await _cached_scrape(
+                _jobs_cache_key(request.keywords, request.location,
+                                request.sources, request.remote_only),
+                service.scrape_jobs_async,
                 keywords=request.keywords,
                 location=request.location,
                 sources=request.sources,
                 remote_only=request.remote_only
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
                 'total': sum(len(v) for v in results.values()),
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/api/scrape/jobs/ai-automation", tags=["Browserless Scrapers"])
+    @app.get("/api/scrape/jobs/ai-automation", tags=["Browserless Scrapers"],
+             response_class=ORJSONResponse)
     async def scrape_ai_automation_jobs():
         """
         Quick endpoint to scrape AI Automation jobs from all sources
         """
         try:
             service = get_service()
-            results = service.scrape_jobs(
+            results = await _cached_scrape(
+                _jobs_cache_key("AI automation specialist", "remote", ['indeed', 'wellfound', 'remote_co']),
+                service.scrape_jobs_async,
                 keywords="AI automation specialist",
                 location="remote",
                 sources=['indeed', 'wellfound', 'remote_co']
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
                 'total': sum(len(v) for v in results.values()),
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/api/scrape/jobs/healthcare-liaison", tags=["Browserless Scrapers"])
+    @app.get("/api/scrape/jobs/healthcare-liaison", tags=["Browserless Scrapers"],
+             response_class=ORJSONResponse)
     async def scrape_healthcare_liaison_jobs():
         """
         Quick endpoint to scrape Healthcare Liaison jobs
         """
         try:
             service = get_service()
-            results = service.scrape_jobs(
+            results = await _cached_scrape(
+                _jobs_cache_key("healthcare liaison remote", "remote", ['indeed', 'flexjobs']),
+                service.scrape_jobs_async,
                 keywords="healthcare liaison remote",
                 location="remote",
                 sources=['indeed', 'flexjobs']
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
                 'total': sum(len(v) for v in results.values()),
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -211,7 +354,8 @@ def register_browserless_routes(app: FastAPI):
     # PROPERTY SCRAPING ENDPOINTS
     # ============================================
     
-    @app.post("/api/scrape/property", response_model=PropertySearchResponse, tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/property", responses={200: {"model": PropertySearchResponse}}, tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def scrape_property(request: PropertySearchRequest):
         """
         Scrape property information using Browserless.io + Spokeo
@@ -220,37 +364,40 @@ def register_browserless_routes(app: FastAPI):
         """
         try:
             service = get_service()
-            results = service.scrape_property(
+            results = await run_in_threadpool(
+                service.scrape_property,
                 address=request.address,
                 city=request.city,
                 state=request.state,
                 zipcode=request.zipcode
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.post("/api/scrape/person", tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/person", tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def scrape_person(request: PersonSearchRequest):
         """
         Search for person information using Browserless.io
         """
         try:
             service = get_service()
-            results = service.scrape_person(
+            results = await run_in_threadpool(
+                service.scrape_person,
                 name=request.name,
                 city=request.city,
                 state=request.state
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -258,7 +405,8 @@ def register_browserless_routes(app: FastAPI):
     # INSTAGRAM SCRAPING
     # ============================================
     
-    @app.get("/api/scrape/instagram/{username}", tags=["Browserless Scrapers"])
+    @app.get("/api/scrape/instagram/{username}", tags=["Browserless Scrapers"],
+             response_class=ORJSONResponse)
     async def scrape_instagram(username: str):
         """
         Scrape Instagram profile using Browserless.io
@@ -267,28 +415,35 @@ def register_browserless_routes(app: FastAPI):
         """
         try:
             service = get_service()
-            profile = service.scrape_instagram(username)
-            return {
+            profile = await _cached_scrape(
+                _instagram_cache_key(username),
+                run_in_threadpool, service.scrape_instagram, username
+            )
+            return ORJSONResponse({
                 'status': 'success',
                 'data': profile,
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.post("/api/scrape/instagram", tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/instagram", tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def scrape_instagram_post(request: InstagramRequest):
         """
         Scrape Instagram profile (POST version)
         """
         try:
             service = get_service()
-            profile = service.scrape_instagram(request.username)
-            return {
+            profile = await _cached_scrape(
+                _instagram_cache_key(request.username),
+                run_in_threadpool, service.scrape_instagram, request.username
+            )
+            return ORJSONResponse({
                 'status': 'success',
                 'data': profile,
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -296,7 +451,8 @@ def register_browserless_routes(app: FastAPI):
     # STEM CELL / PRP CLINIC SCRAPING
     # ============================================
     
-    @app.post("/api/scrape/closed-clinics", tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/closed-clinics", tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def scrape_closed_clinics(request: ClosedClinicsRequest):
         """
         Search for closed stem cell/PRP treatment centers
@@ -305,36 +461,41 @@ def register_browserless_routes(app: FastAPI):
         """
         try:
             service = get_service()
-            results = service.scrape_closed_clinics(
+            results = await _cached_scrape(
+                _clinics_cache_key(request.cities, request.state),
+                service.scrape_closed_clinics_async,
                 cities=request.cities,
                 state=request.state
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
                 'total': sum(len(v) for v in results.values()),
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/api/scrape/closed-clinics/texas", tags=["Browserless Scrapers"])
+    @app.get("/api/scrape/closed-clinics/texas", tags=["Browserless Scrapers"],
+             response_class=ORJSONResponse)
     async def scrape_texas_closed_clinics():
         """
         Quick endpoint to search for closed clinics in Austin, San Antonio, Houston
         """
         try:
             service = get_service()
-            results = service.scrape_closed_clinics(
+            results = await _cached_scrape(
+                _clinics_cache_key(['Austin', 'San Antonio', 'Houston'], 'TX'),
+                service.scrape_closed_clinics_async,
                 cities=['Austin', 'San Antonio', 'Houston'],
                 state='TX'
             )
-            return {
+            return ORJSONResponse({
                 'status': 'success',
                 'data': results,
                 'total': sum(len(v) for v in results.values()),
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            }, headers=CACHE_HEADERS)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -342,7 +503,8 @@ def register_browserless_routes(app: FastAPI):
     # PAGE CONTENT & SCREENSHOT ENDPOINTS
     # ============================================
     
-    @app.post("/api/scrape/content", tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/content", tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def get_page_content(request: PageContentRequest):
         """
         Get rendered page content using Browserless.io
@@ -351,72 +513,69 @@ def register_browserless_routes(app: FastAPI):
         """
         try:
             service = get_service()
-            content = service.get_page_content(request.url, request.wait_for)
-            return {
+            content = await service.get_page_content_async(request.url, request.wait_for)
+            return ORJSONResponse({
                 'status': 'success',
                 'content': content[:50000] if content else None,  # Limit response size
                 'full_length': len(content) if content else 0,
                 'truncated': len(content) > 50000 if content else False,
-                'timestamp': datetime.now().isoformat()
-            }
+                'timestamp': datetime.now()
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.post("/api/scrape/screenshot", tags=["Browserless Scrapers"])
+    @app.post("/api/scrape/screenshot", responses={200: {"model": ScreenshotResponse}}, tags=["Browserless Scrapers"],
+              response_class=ORJSONResponse)
     async def take_screenshot(request: PageContentRequest):
         """
         Take screenshot of a URL using Browserless.io
         
-        Returns base64 encoded PNG image
+        Returns base64 encoded PNG image (up to 256 KB; use /screenshot/raw
+        for full-page or high-resolution captures)
         """
         try:
             service = get_service()
-            screenshot = service.take_screenshot(request.url, request.full_page)
+            upstream = await service.stream_screenshot_async(request.url, request.full_page)
+            screenshot = await _read_capped(upstream, MAX_INLINE_SCREENSHOT_BYTES)
             if screenshot:
-                return {
+                return ORJSONResponse({
                     'status': 'success',
                     'image': base64.b64encode(screenshot).decode('utf-8'),
                     'content_type': 'image/png',
                     'size_bytes': len(screenshot),
-                    'timestamp': datetime.now().isoformat()
-                }
+                    'timestamp': datetime.now()
+                })
             raise HTTPException(status_code=500, detail="Failed to capture screenshot")
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.post("/api/scrape/screenshot/raw", tags=["Browserless Scrapers"])
     async def take_screenshot_raw(request: PageContentRequest):
         """
-        Take screenshot and return as raw PNG image
+        Take screenshot and stream it back as a raw PNG image
         """
         try:
             service = get_service()
-            screenshot = service.take_screenshot(request.url, request.full_page)
-            if screenshot:
-                return Response(
-                    content=screenshot,
-                    media_type="image/png",
-                    headers={"Content-Disposition": f"attachment; filename=screenshot.png"}
-                )
-            raise HTTPException(status_code=500, detail="Failed to capture screenshot")
+            upstream = await service.stream_screenshot_async(request.url, request.full_page)
+            return _stream_upstream(upstream, "image/png", "screenshot.png")
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.post("/api/scrape/pdf", tags=["Browserless Scrapers"])
     async def generate_pdf(request: PageContentRequest):
         """
-        Generate PDF from URL using Browserless.io
+        Generate PDF from URL using Browserless.io and stream it back
         """
         try:
             service = get_service()
-            pdf = service.generate_pdf(request.url)
-            if pdf:
-                return Response(
-                    content=pdf,
-                    media_type="application/pdf",
-                    headers={"Content-Disposition": f"attachment; filename=page.pdf"}
-                )
-            raise HTTPException(status_code=500, detail="Failed to generate PDF")
+            upstream = await service.stream_pdf_async(request.url)
+            return _stream_upstream(upstream, "application/pdf", "page.pdf")
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -424,18 +583,19 @@ def register_browserless_routes(app: FastAPI):
     # HEALTH & STATUS
     # ============================================
     
-    @app.get("/api/scrape/health", tags=["Browserless Scrapers"])
+    @app.get("/api/scrape/health", tags=["Browserless Scrapers"],
+             response_class=ORJSONResponse)
     async def browserless_health():
         """
         Check Browserless.io connection status
         """
         api_key = os.environ.get('BROWSERLESS_API_KEY', '')
-        return {
+        return ORJSONResponse({
             'status': 'ok' if api_key else 'not_configured',
             'api_key_set': bool(api_key),
             'api_key_preview': f"{api_key[:8]}..." if api_key else None,
-            'timestamp': datetime.now().isoformat()
-        }
+            'timestamp': datetime.now()
+        })
     
     print("✓ Browserless.io endpoints registered:")
     print("  POST /api/scrape/jobs")
@@ -461,7 +621,8 @@ def create_standalone_app() -> FastAPI:
     app = FastAPI(
         title="StormBuster Browserless Scraper API",
         description="Unified scraping service using Browserless.io",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse
     )
     
     register_browserless_routes(app)
@@ -480,6 +641,7 @@ def create_standalone_app() -> FastAPI:
 
 # For running standalone
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
     print("=" * 50)
@@ -487,5 +649,10 @@ if __name__ == "__main__":
     print("=" * 50)
     
     app = create_standalone_app()
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(
+        app, host="0.0.0.0", port=8001,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # no uvloop on Windows
+        http="httptools",
+        access_log=False
+    )
 
@@ -17,13 +17,28 @@ Get your API key at: https://browserless.io
 
 import os
 import json
+import logging
+import math
+import random
 import time
+import asyncio
+import hashlib
+import threading
+import uuid
+import sys
+import zlib
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+import httpx
 import requests
-from typing import Dict, List, Optional, Any
-from bs4 import BeautifulSoup
-from dataclasses import dataclass, asdict
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
+from urllib.parse import quote_plus
 import base64
+import html as html_lib
 import re
 
 # Load environment variables
@@ -33,27 +48,233 @@ try:
 except ImportError:
     pass
 
-print("=" * 70)
-print("STORMBUSTER BROWSERLESS.IO INTEGRATION")
-print("=" * 70)
-print("\nFeatures Available:")
-print("  ✓ Headless Chrome Browser Automation")
-print("  ✓ JavaScript Page Rendering")
-print("  ✓ Multi-Platform Job Scraping")
-print("  ✓ Property Data Enrichment")
-print("  ✓ Instagram Profile Scraping")
-print("  ✓ Screenshot & PDF Generation")
-print("  ✓ Unified Scraper API")
+# Fast C HTML parser; BeautifulSoup is used as a fallback when it is missing.
+# selectolax 1.0 removed the Modest backend, so prefer Lexbor (same node API)
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+# Faster JSON for request bodies and responses; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Incremental JSON parser for scrape_iter(); the body is parsed whole otherwise
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Shared rate limit across worker processes when REDIS_URL is set
+try:
+    import redis
+    import redis.asyncio
+except ImportError:
+    redis = None
+
+# Lets requests/httpx decode Brotli bodies; br is only advertised when installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Library output goes to this logger and is silent unless the app
+# configures logging; per-call messages are DEBUG/INFO
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# ============================================
+# JSON ENCODING
+# ============================================
+
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a request body"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def _load_json(content: bytes) -> Any:
+    """Parse a response body"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# ============================================
+# HTML PARSING
+# ============================================
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str):
+    """Compile a CSS selector once; the scrapers reuse the same few literals per card"""
+    import soupsieve
+    return soupsieve.compile(selector)
+
+
+class _SoupNode:
+    """
+    The subset of selectolax's Node API the scrapers use, over a BeautifulSoup tag
+    
+    Lets the parsers below be written once against selectolax and still run
+    where only bs4 is installed.
+    """
+    
+    __slots__ = ('_tag',)
+    
+    def __init__(self, tag):
+        self._tag = tag
+    
+    def css(self, selector: str) -> List['_SoupNode']:
+        return [_SoupNode(tag) for tag in _compile_selector(selector).select(self._tag)]
+    
+    def css_first(self, selector: str, default=None):
+        tag = _compile_selector(selector).select_one(self._tag)
+        return default if tag is None else _SoupNode(tag)
+    
+    def text(self, deep: bool = True, separator: str = '', strip: bool = False) -> str:
+        return self._tag.get_text(separator, strip=strip)
+    
+    @property
+    def attributes(self) -> Dict[str, str]:
+        # bs4 returns multi-valued attributes such as class as lists
+        return {
+            name: ' '.join(value) if isinstance(value, list) else value
+            for name, value in self._tag.attrs.items()
+        }
+
+
+@lru_cache(maxsize=1)
+def _soup_features() -> str:
+    """bs4 tree builder: libxml2 via lxml when installed, the pure-Python parser otherwise"""
+    try:
+        import lxml  # noqa: F401
+        return 'lxml'
+    except ImportError:
+        return 'html.parser'
+
+
+@lru_cache(maxsize=32)
+def _soup_strainer(tags: Tuple[str, ...], classes: Tuple[str, ...]):
+    """SoupStrainer keeping only the given tags, or only elements with the given classes"""
+    from bs4 import SoupStrainer
+    if tags:
+        return SoupStrainer(list(tags))
+    
+    # Match on any one class; newer bs4 compares the whole class string otherwise
+    wanted = frozenset(classes)
+    return SoupStrainer(class_=lambda value: bool(value) and not wanted.isdisjoint(value.split()))
+
+
+def _has_markers(html: Optional[str], markers: Tuple[str, ...]) -> bool:
+    """
+    Cheap pre-parse check that a page can contain any result cards
+    
+    markers are substrings every matching card must contain (class names,
+    attribute names); error and consent pages fail the scan and skip parsing.
+    """
+    return bool(html) and any(marker in html for marker in markers)
+
+
+def parse_html(html: str, only_tags: Tuple[str, ...] = (), only_classes: Tuple[str, ...] = ()):
+    """
+    Parse rendered HTML into a tree queried with .css() / .css_first()
+    
+    Args:
+        html: Rendered page
+        only_tags: On the BeautifulSoup fallback, build the tree from just these tags
+        only_classes: On the BeautifulSoup fallback, build the tree from just the
+            elements carrying one of these classes (and their children)
+    
+    selectolax parses the whole page fast enough that it ignores the filters.
+    """
+    if HTMLParser is not None:
+        return HTMLParser(html)
+    
+    from bs4 import BeautifulSoup
+    strainer = _soup_strainer(only_tags, only_classes) if only_tags or only_classes else None
+    return _SoupNode(BeautifulSoup(html, _soup_features(), parse_only=strainer))
+
+
+# ============================================
+# RESPONSE CACHE
+# ============================================
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache whose entries expire after ttl seconds
+    
+    Once maxsize entries are held, the oldest entry is evicted first.
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expiry = item
+            if time.monotonic() < expiry:
+                return value
+            del self._data[key]
+            return default
+    
+    def set(self, key, value):
+        """Store a value for the next ttl seconds"""
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (value, time.monotonic() + self.ttl)
+    
+    def pop(self, key, default=None):
+        """Drop a key, returning its value if it was cached"""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[0]
+    
+    def pop_where(self, predicate) -> int:
+        """Drop every key for which predicate(key) is true and return how many"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_cache_key(*parts) -> bytes:
+    """Stable 16-byte key for JSON-serializable request parameters"""
+    raw = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).digest()
 
 
 # ============================================
 # BROWSERLESS.IO CLIENT
 # ============================================
 
-class BrowserlessClient:
+class BaseBrowserlessClient:
     """
-    Browserless.io API Client
-    Provides headless Chrome browser automation via API
+    Configuration and request payloads shared by the sync and async clients
     
     Endpoints:
     - /content - Get rendered HTML
@@ -63,47 +284,570 @@ class BrowserlessClient:
     - /function - Execute custom scripts
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, requests_per_second: float = None, burst: int = None):
         self.api_key = api_key or os.environ.get('BROWSERLESS_API_KEY', '')
         self.base_url = os.environ.get('BROWSERLESS_URL', 'https://chrome.browserless.io')
         
         if not self.api_key:
-            print("\n⚠️  BROWSERLESS_API_KEY not set!")
-            print("   Get your API key at: https://browserless.io")
-            print("   Set it in environment: BROWSERLESS_API_KEY=your_key")
+            logger.warning("BROWSERLESS_API_KEY not set; get a key at https://browserless.io")
         else:
-            print(f"\n✓ Browserless API configured: {self.base_url}")
+            logger.info("Browserless API configured: %s", self.base_url)
+        
+        # Per-call URLs and auth params never change, so build them once
+        self.api_url = self.base_url
+        self._endpoints = {
+            name: f"{self.base_url}/{name}"
+            for name in ('content', 'screenshot', 'pdf', 'scrape', 'function')
+        }
+        self._auth_params = {'token': self.api_key}
         
         self.headers = {
             'Content-Type': 'application/json',
-            'Cache-Control': 'no-cache'
+            'Cache-Control': 'no-cache',
+            # Rendered HTML and scrape JSON compress 5-10x; PNG/PDF bodies gain nothing
+            'Accept-Encoding': 'br, gzip' if brotli is not None else 'gzip'
+        }
+        # PNG/PDF bodies are asked for uncompressed, so a relayed
+        # Content-Length always matches the bytes actually streamed
+        self.binary_headers = {'Accept-Encoding': 'identity'}
+        
+        # Rate limiting: token bucket refilled at requests_per_second, holding
+        # up to burst tokens, so short bursts go out at once but the average
+        # rate stays capped
+        self.requests_per_second = float(
+            requests_per_second or os.environ.get('BROWSERLESS_RPS', '1')
+        )
+        self.burst = int(burst or os.environ.get('BROWSERLESS_BURST', '5'))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        
+        # With several workers each bucket would allow the full rate, so a
+        # Redis URL moves the limit to one rolling window shared by all of them
+        self.redis_url = os.environ.get('REDIS_URL') if redis is not None else None
+        self.rate_limit_key = os.environ.get('BROWSERLESS_RATE_LIMIT_KEY', 'browserless:rl')
+        
+        # How long Browserless keeps a tracked session's Chrome alive between calls
+        self.session_keepalive_ms = int(os.environ.get('BROWSERLESS_KEEPALIVE_MS', '60000'))
+        
+        # Rendered content, PDFs and scrape results keyed by endpoint + payload,
+        # so re-requesting a URL within the TTL skips the upstream render
+        self._cache = TTLCache(maxsize=512, ttl=float(os.environ.get('BROWSERLESS_CACHE_TTL', '300')))
+        
+        # Pages Browserless reported as gone (404/410 or unresolvable host);
+        # calls for them return straight away for a day instead of rendering
+        self._dead_urls = TTLCache(maxsize=10000, ttl=float(os.environ.get('BROWSERLESS_DEAD_URL_TTL', '86400')))
+    
+    def _get_auth_params(self, session_id: str = None) -> Dict:
+        """Get authentication parameters, optionally pinned to a browser session"""
+        if not session_id:
+            return self._auth_params
+        
+        # Calls sharing a trackingId reuse the same warm Chrome process
+        return {
+            **self._auth_params,
+            'trackingId': session_id,
+            'keepalive': str(self.session_keepalive_ms)
+        }
+    
+    @staticmethod
+    def _new_session_id() -> str:
+        """Generate a Browserless trackingId"""
+        return uuid.uuid4().hex
+    
+    def _rate_limit_delay(self) -> float:
+        """Take a token from the bucket and return how long to wait for it"""
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last_refill) * self.requests_per_second
+            )
+            self._last_refill = now
+            
+            # Going negative reserves a future token, so concurrent callers
+            # queue up one refill interval apart instead of all waking at once
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+    
+    # Rolling-window limiter run atomically in Redis: records a call and
+    # returns 0 if fewer than ARGV[3] calls fall in the last ARGV[2] ms,
+    # otherwise returns how many ms until the oldest one leaves the window
+    GLOBAL_RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+  redis.call('ZADD', KEYS[1], now, ARGV[4])
+  redis.call('PEXPIRE', KEYS[1], window)
+  return 0
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+    
+    def _global_rate_limit_args(self) -> List:
+        """Script arguments for one call: same burst and average rate as the local bucket"""
+        window_ms = int(1000 * self.burst / self.requests_per_second)
+        return [int(time.time() * 1000), window_ms, self.burst, uuid.uuid4().hex]
+    
+    # ============================================
+    # RETRIES
+    # ============================================
+    
+    # Transient Browserless failures are retried on the render endpoints;
+    # /function runs arbitrary code, so it is never retried
+    RETRY_STATUSES = (429, 502, 503, 504)
+    RETRY_ATTEMPTS = 4
+    RETRY_BACKOFF = 0.5
+    RETRY_BACKOFF_MAX = 15.0
+    
+    def _retry_delay(self, attempt: int, retry_after: str = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else full-jitter backoff"""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = None
+        # A negative or NaN header would make time.sleep() raise
+        if delay is not None and math.isfinite(delay):
+            return min(max(delay, 0.0), self.RETRY_BACKOFF_MAX)
+        
+        # Random spread keeps clients that failed together from retrying together
+        return random.uniform(0, min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF * 2 ** (attempt - 1)))
+    
+    # ============================================
+    # RESPONSE CACHE
+    # ============================================
+    
+    def _response_key(self, endpoint: str, payload: Dict, no_cache: bool = False) -> Optional[tuple]:
+        """Cache key for an idempotent call, or None to bypass the cache"""
+        if no_cache or self._cache.ttl <= 0:
+            return None
+        return (payload['url'], make_cache_key(endpoint, payload))
+    
+    def _cached_response(self, key: Optional[tuple]):
+        """Return the cached result for a key, or None"""
+        return None if key is None else self._cache.get(key)
+    
+    def _store_response(self, key: Optional[tuple], value):
+        """Cache a successful, non-empty result"""
+        if key is not None and value:
+            self._cache.set(key, value)
+    
+    def invalidate(self, url: str) -> int:
+        """Drop every cached response for a URL and return how many were dropped"""
+        self._dead_urls.pop(url)
+        return self._cache.pop_where(lambda key: key[0] == url)
+    
+    # Shared Redis cache (when REDIS_URL is set) behind the in-process one,
+    # so every worker reuses a render; values are zlib-compressed
+    REDIS_CACHE_PREFIX = 'browserless:cache:'
+    
+    def _redis_cache_key(self, key: tuple) -> str:
+        """Redis key for a response cache key, grouped by URL so invalidate() can find it"""
+        return f"{self._redis_url_prefix(key[0])}{key[1].hex()}"
+    
+    def _redis_url_prefix(self, url: str) -> str:
+        """Prefix shared by every Redis cache entry for a URL"""
+        return f"{self.REDIS_CACHE_PREFIX}{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}:"
+    
+    @staticmethod
+    def _encode_cached(value) -> bytes:
+        """Compress a cached result for Redis, tagged with its type"""
+        if isinstance(value, bytes):
+            tag, raw = b'b', value
+        elif isinstance(value, str):
+            tag, raw = b's', value.encode()
+        else:
+            tag, raw = b'j', _dump_json(value)
+        return tag + zlib.compress(raw, 3)
+    
+    @staticmethod
+    def _decode_cached(blob: bytes):
+        """Inverse of _encode_cached"""
+        tag, raw = blob[:1], zlib.decompress(blob[1:])
+        if tag == b'b':
+            return raw
+        if tag == b's':
+            return raw.decode()
+        return _load_json(raw)
+    
+    # ============================================
+    # DEAD URLS
+    # ============================================
+    
+    DEAD_URL_STATUSES = ('404', '410')
+    
+    def _is_dead_url(self, url: str) -> bool:
+        """Whether a URL recently turned out to be gone"""
+        if self._dead_urls.get(url):
+            logger.debug("Skipping dead URL: %.60s", url)
+            return True
+        return False
+    
+    def _note_dead_url(self, url: str, response) -> bool:
+        """Remember url as dead if Browserless reports the page itself as gone"""
+        # X-Response-Code carries the status the target page returned; a 4xx
+        # from Browserless itself (bad token, bad payload) says nothing about the URL
+        dead = response.headers.get('X-Response-Code') in self.DEAD_URL_STATUSES or (
+            response.status_code == 400 and 'ERR_NAME_NOT_RESOLVED' in response.text
+        )
+        if dead:
+            logger.info("Dead URL, skipping for now: %.60s", url)
+            self._dead_urls.set(url, True)
+        return dead
+    
+    def _split_cached(self, endpoint: str, payloads: Dict[str, Dict],
+                      no_cache: bool = False) -> Tuple[Dict[str, Any], Dict[str, Optional[tuple]], List[str]]:
+        """Look up a batch of per-URL payloads; return results, keys and the URLs still missing"""
+        keys = {url: self._response_key(endpoint, payload, no_cache) for url, payload in payloads.items()}
+        results = {url: self._cached_response(key) for url, key in keys.items()}
+        missing = [url for url, result in results.items() if result is None]
+        return results, keys, missing
+    
+    def _merge_batch(self, results: Dict[str, Any], keys: Dict[str, Optional[tuple]],
+                     missing: List[str], fetched: Optional[Dict]) -> Dict[str, Any]:
+        """Fill in freshly fetched results and cache them"""
+        fetched = fetched or {}
+        for url in missing:
+            results[url] = fetched.get(url)
+            self._store_response(keys[url], results[url])
+        return results
+    
+    # ============================================
+    # FILE DOWNLOADS
+    # ============================================
+    
+    # Screenshots and PDFs are copied to disk in chunks this size, so a
+    # multi-MB render never sits in memory whole
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    
+    @staticmethod
+    @contextmanager
+    def _output_file(target):
+        """Open a path for binary writing (or pass a file object through), removing it on error"""
+        if hasattr(target, 'write'):
+            yield target
+            return
+        
+        try:
+            with open(target, 'wb') as f:
+                yield f
+        except BaseException:
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+            raise
+    
+    # ============================================
+    # REQUEST PAYLOADS
+    # ============================================
+    
+    # Fixed parts of the request bodies, shared by every payload (read-only)
+    _GOTO_OPTIONS = {'waitUntil': 'networkidle2'}
+    _PDF_MARGIN = {'top': '1cm', 'right': '1cm', 'bottom': '1cm', 'left': '1cm'}
+    
+    @staticmethod
+    def _content_payload(url: str, wait_for: str = None, timeout: int = 30000) -> Dict:
+        """Build a /content request body"""
+        payload = {
+            'url': url,
+            'gotoOptions': {
+                'waitUntil': 'networkidle2',
+                'timeout': timeout
+            }
         }
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0  # seconds
+        if wait_for:
+            payload['waitForSelector'] = {
+                'selector': wait_for,
+                'timeout': timeout
+            }
+        
+        return payload
     
-    @property
-    def api_url(self) -> str:
-        """Get base API URL"""
-        return f"{self.base_url}"
+    @staticmethod
+    def _screenshot_payload(url: str, full_page: bool = False,
+                            width: int = 1920, height: int = 1080) -> Dict:
+        """Build a /screenshot request body"""
+        return {
+            'url': url,
+            'options': {
+                'fullPage': full_page,
+                'type': 'png'
+            },
+            'gotoOptions': BaseBrowserlessClient._GOTO_OPTIONS,
+            'viewport': {
+                'width': width,
+                'height': height
+            }
+        }
+    
+    @staticmethod
+    def _pdf_payload(url: str, format: str = 'A4') -> Dict:
+        """Build a /pdf request body"""
+        return {
+            'url': url,
+            'options': {
+                'format': format,
+                'printBackground': True,
+                'margin': BaseBrowserlessClient._PDF_MARGIN
+            },
+            'gotoOptions': BaseBrowserlessClient._GOTO_OPTIONS
+        }
+    
+    @staticmethod
+    def _scrape_payload(url: str, selectors: Dict[str, str], wait_for: str = None) -> Dict:
+        """Build a /scrape request body"""
+        elements = [
+            {'selector': selector, 'name': name}
+            for name, selector in selectors.items()
+        ]
+        
+        payload = {
+            'url': url,
+            'elements': elements,
+            'gotoOptions': BaseBrowserlessClient._GOTO_OPTIONS
+        }
+        
+        if wait_for:
+            payload['waitForSelector'] = {'selector': wait_for}
+        
+        return payload
+    
+    # Batched rendering: /function runs this code next to one Chrome page,
+    # so K URLs cost one HTTP round-trip and one browser start-up
+    CONTENT_MANY_CODE = """
+module.exports = async ({ page, context }) => {
+  const { urls, waitFor, timeout } = context;
+  const results = {};
+  for (const url of urls) {
+    try {
+      await page.goto(url, { waitUntil: 'networkidle2', timeout });
+      if (waitFor) await page.waitForSelector(waitFor, { timeout });
+      results[url] = await page.content();
+    } catch (e) {
+      results[url] = null;
+    }
+  }
+  return { data: results, type: 'application/json' };
+};
+"""
+    
+    # Same result shape per URL as the /scrape endpoint
+    SCRAPE_MANY_CODE = """
+module.exports = async ({ page, context }) => {
+  const { urls, elements, waitFor } = context;
+  const results = {};
+  for (const url of urls) {
+    try {
+      await page.goto(url, { waitUntil: 'networkidle2' });
+      if (waitFor) await page.waitForSelector(waitFor);
+      const data = await page.evaluate((elements) => elements.map(({ selector }) => ({
+        selector,
+        results: Array.from(document.querySelectorAll(selector)).map((el) => ({
+          text: el.innerText,
+          html: el.innerHTML
+        }))
+      })), elements);
+      results[url] = { data };
+    } catch (e) {
+      results[url] = null;
+    }
+  }
+  return { data: results, type: 'application/json' };
+};
+"""
+    
+    @staticmethod
+    def _function_payload(code: str, context: Dict = None) -> Dict:
+        """Build a /function request body"""
+        payload = {
+            'code': code
+        }
+        
+        if context:
+            payload['context'] = context
+        
+        return payload
+
+
+class BrowserlessClient(BaseBrowserlessClient):
+    """
+    Browserless.io API Client
+    Provides headless Chrome browser automation via API
+    
+    Requests share one requests.Session, so keep-alive connections are
+    reused instead of paying a TCP + TLS handshake per call. Connection
+    errors, timeouts, 429s and gateway errors are retried with jittered
+    backoff, honouring Retry-After (except on /function); every attempt
+    takes a rate-limit token.
+    
+    Calls can also be pinned to one Browserless session (trackingId +
+    keepalive) so they reuse a warm remote Chrome instead of cold-starting
+    one each time. A session runs one call at a time and keeps cookies and
+    page state between calls, so only share it within a single logical
+    scrape job, not across threads.
+    """
+    
+    def __init__(self, api_key: str = None, requests_per_second: float = None, burst: int = None,
+                 session_id: str = None):
+        super().__init__(api_key, requests_per_second, burst)
+        
+        # Browserless trackingId every call is pinned to (None for no session)
+        self.session_id = session_id
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Room for get_many_contents() fan-out plus threadpool-run scrapers,
+        # so connections are reused rather than discarded when the pool is full.
+        # No adapter retries: _send() retries, taking a token per attempt
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self._redis = None
+        self._global_limiter = None
+        if self.redis_url:
+            self._redis = redis.Redis.from_url(self.redis_url)
+            self._global_limiter = self._redis.register_script(self.GLOBAL_RATE_LIMIT_SCRIPT)
+    
+    def close(self):
+        """End the browser session, if any, and close pooled connections"""
+        self.close_session()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    # ============================================
+    # BROWSER SESSION
+    # ============================================
     
-    def _get_auth_params(self) -> Dict:
-        """Get authentication parameters"""
-        return {'token': self.api_key}
+    def start_session(self) -> str:
+        """Pin subsequent calls to a fresh Browserless session and return its id"""
+        self.close_session()
+        self.session_id = self._new_session_id()
+        return self.session_id
+    
+    def close_session(self):
+        """Ask Browserless to release the pinned session's Chrome process"""
+        session_id, self.session_id = self.session_id, None
+        if not session_id:
+            return
+        
+        try:
+            self.session.delete(
+                f"{self.api_url}/session/{session_id}",
+                params=self._get_auth_params(),
+                timeout=10
+            )
+        except requests.exceptions.RequestException:
+            pass  # Browserless expires it after keepalive anyway
+    
+    @contextmanager
+    def browser_session(self):
+        """Run a block of calls on one warm Browserless session, closed afterwards"""
+        session_id = self.start_session()
+        try:
+            yield session_id
+        finally:
+            self.close_session()
+    
+    def _cached_response(self, key: Optional[tuple]):
+        """Return the cached result for a key from this process or Redis, or None"""
+        value = super()._cached_response(key)
+        if value is not None or key is None or self._redis is None:
+            return value
+        
+        try:
+            blob = self._redis.get(self._redis_cache_key(key))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+            return None
+        if blob is None:
+            return None
+        
+        value = self._decode_cached(blob)
+        self._cache.set(key, value)
+        return value
+    
+    def _store_response(self, key: Optional[tuple], value):
+        """Cache a successful, non-empty result here and in Redis"""
+        super()._store_response(key, value)
+        if key is None or not value or self._redis is None:
+            return
+        
+        try:
+            self._redis.setex(self._redis_cache_key(key), int(self._cache.ttl), self._encode_cached(value))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+    
+    def invalidate(self, url: str) -> int:
+        """Drop every cached response for a URL, here and in Redis"""
+        dropped = super().invalidate(url)
+        if self._redis is not None:
+            try:
+                keys = list(self._redis.scan_iter(match=self._redis_url_prefix(url) + '*'))
+                if keys:
+                    dropped += self._redis.delete(*keys)
+            except redis.RedisError as e:
+                logger.warning("Redis cache unavailable: %s", e)
+        return dropped
+    
+    def _send(self, endpoint: str, **kwargs) -> requests.Response:
+        """POST to a Browserless endpoint, retrying transient failures with jittered backoff"""
+        attempts = 1 if endpoint == 'function' else self.RETRY_ATTEMPTS
+        for attempt in range(1, attempts + 1):
+            # Every attempt takes a token, so retries respect the rate limit
+            self._rate_limit()
+            try:
+                response = self.session.post(self._endpoints[endpoint], **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == attempts:
+                    raise
+                delay = self._retry_delay(attempt)
+                reason = type(e).__name__
+            else:
+                if attempt == attempts or response.status_code not in self.RETRY_STATUSES:
+                    return response
+                delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                reason = f"HTTP {response.status_code}"
+                response.close()
+            
+            logger.warning("Browserless /%s %s; retry %d/%d in %.1fs",
+                           endpoint, reason, attempt, attempts - 1, delay)
+            time.sleep(delay)
     
     def _rate_limit(self):
         """Implement rate limiting between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        if self._global_limiter is not None:
+            try:
+                while True:
+                    wait_ms = self._global_limiter(keys=[self.rate_limit_key],
+                                                   args=self._global_rate_limit_args())
+                    if not wait_ms:
+                        return
+                    time.sleep(wait_ms / 1000)
+            except redis.RedisError as e:
+                logger.warning("Redis rate limiter unavailable, using local limit: %s", e)
+        
+        delay = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
     
     # ============================================
     # CORE BROWSERLESS METHODS
     # ============================================
     
-    def get_content(self, url: str, wait_for: str = None, timeout: int = 30000) -> Optional[str]:
+    def get_content(self, url: str, wait_for: str = None, timeout: int = 30000,
+                    no_cache: bool = False) -> Optional[str]:
         """
         Get rendered HTML content from a URL
         Uses Browserless /content endpoint
@@ -112,50 +856,68 @@ class BrowserlessClient:
             url: Page URL to render
             wait_for: CSS selector to wait for before returning
             timeout: Maximum time to wait in milliseconds
+            no_cache: Always render, skipping the response cache
         
         Returns:
             Rendered HTML content or None on error
         """
-        self._rate_limit()
+        payload = self._content_payload(url, wait_for, timeout)
+        key = self._response_key('content', payload, no_cache)
+        if self._is_dead_url(url):
+            return None
+        
+        cached = self._cached_response(key)
+        if cached is not None:
+            logger.debug("Cached content: %.60s", url)
+            return cached
         
         try:
-            endpoint = f"{self.api_url}/content"
+            logger.debug("Fetching content: %.60s...", url)
             
-            payload = {
-                'url': url,
-                'gotoOptions': {
-                    'waitUntil': 'networkidle2',
-                    'timeout': timeout
-                }
-            }
-            
-            if wait_for:
-                payload['waitForSelector'] = {
-                    'selector': wait_for,
-                    'timeout': timeout
-                }
-            
-            print(f"  📄 Fetching content: {url[:60]}...")
-            
-            response = requests.post(
-                endpoint,
-                params=self._get_auth_params(),
-                headers=self.headers,
-                json=payload,
+            response = self._send(
+                'content',
+                params=self._get_auth_params(self.session_id),
+                data=_dump_json(payload),
                 timeout=timeout // 1000 + 10
             )
+            if self._note_dead_url(url, response):
+                return None
             response.raise_for_status()
             
-            print(f"  ✓ Content received: {len(response.text)} bytes")
+            logger.info("Content received: %d bytes", len(response.text))
+            self._store_response(key, response.text)
             return response.text
             
         except requests.exceptions.Timeout:
-            print(f"  ❌ Timeout fetching: {url}")
+            logger.error("Timeout fetching: %s", url)
             return None
         except requests.exceptions.RequestException as e:
-            print(f"  ❌ Browserless content error: {e}")
+            logger.error("Browserless content error: %s", e)
             return None
     
+    def get_many_contents(self, urls: List[str], wait_for: str = None,
+                          timeout: int = 30000, max_concurrency: int = 8) -> List[Optional[str]]:
+        """
+        Render several URLs concurrently on a small thread pool
+        
+        Threads share the pooled session and the thread-safe rate limiter,
+        and release the GIL while waiting on Browserless.
+        
+        Args:
+            urls: Page URLs to render
+            wait_for: CSS selector to wait for on every page
+            timeout: Maximum time to wait per page in milliseconds
+            max_concurrency: Most renders in flight at once
+        
+        Returns:
+            Rendered HTML (or None on error) for each URL, in input order
+        """
+        if self.session_id:
+            max_concurrency = 1  # a pinned browser session runs one call at a time
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(urls)))) as pool:
+            return list(pool.map(lambda url: self.get_content(url, wait_for, timeout), urls))
+    
     def get_screenshot(self, url: str, full_page: bool = False, 
                        width: int = 1920, height: int = 1080) -> Optional[bytes]:
         """
@@ -171,188 +933,974 @@ class BrowserlessClient:
         Returns:
             PNG image bytes or None on error
         """
-        self._rate_limit()
+        try:
+            payload = self._screenshot_payload(url, full_page, width, height)
+            
+            logger.debug("Taking screenshot: %.60s...", url)
+            
+            response = self._send(
+                'screenshot',
+                params=self._get_auth_params(self.session_id),
+                headers=self.binary_headers,
+                data=_dump_json(payload),
+                timeout=60
+            )
+            response.raise_for_status()
+            
+            logger.info("Screenshot captured: %d bytes", len(response.content))
+            return response.content
+            
+        except Exception as e:
+            logger.error("Browserless screenshot error: %s", e)
+            return None
+    
+    def get_pdf(self, url: str, format: str = 'A4', no_cache: bool = False) -> Optional[bytes]:
+        """
+        Generate PDF from a URL
+        Uses Browserless /pdf endpoint
+        
+        Args:
+            url: Page URL to convert
+            format: Paper format (A4, Letter, etc.)
+            no_cache: Always render, skipping the response cache
+        
+        Returns:
+            PDF bytes or None on error
+        """
+        payload = self._pdf_payload(url, format)
+        key = self._response_key('pdf', payload, no_cache)
+        if self._is_dead_url(url):
+            return None
+        
+        cached = self._cached_response(key)
+        if cached is not None:
+            logger.debug("Cached PDF: %.60s", url)
+            return cached
         
         try:
-            endpoint = f"{self.api_url}/screenshot"
+            logger.debug("Generating PDF: %.60s...", url)
             
-            payload = {
-                'url': url,
-                'options': {
-                    'fullPage': full_page,
-                    'type': 'png'
-                },
-                'gotoOptions': {
-                    'waitUntil': 'networkidle2'
-                },
-                'viewport': {
-                    'width': width,
-                    'height': height
-                }
-            }
+            response = self._send(
+                'pdf',
+                params=self._get_auth_params(self.session_id),
+                headers=self.binary_headers,
+                data=_dump_json(payload),
+                timeout=60
+            )
+            if self._note_dead_url(url, response):
+                return None
+            response.raise_for_status()
             
-            print(f"  📷 Taking screenshot: {url[:60]}...")
+            logger.info("PDF generated: %d bytes", len(response.content))
+            self._store_response(key, response.content)
+            return response.content
             
-            response = requests.post(
-                endpoint,
-                params=self._get_auth_params(),
-                headers=self.headers,
-                json=payload,
+        except Exception as e:
+            logger.error("Browserless PDF error: %s", e)
+            return None
+    
+    def scrape(self, url: str, selectors: Dict[str, str], wait_for: str = None,
+               no_cache: bool = False) -> Dict:
+        """
+        Scrape data using CSS selectors
+        Uses Browserless /scrape endpoint
+        
+        Args:
+            url: Page URL to scrape
+            selectors: Dict mapping names to CSS selectors
+            wait_for: CSS selector to wait for
+            no_cache: Always scrape, skipping the response cache
+        
+        Returns:
+            Dict of scraped data
+        """
+        payload = self._scrape_payload(url, selectors, wait_for)
+        key = self._response_key('scrape', payload, no_cache)
+        if self._is_dead_url(url):
+            return {}
+        
+        cached = self._cached_response(key)
+        if cached is not None:
+            logger.debug("Cached scrape: %.60s", url)
+            return cached
+        
+        try:
+            logger.debug("Scraping: %.60s...", url)
+            
+            response = self._send(
+                'scrape',
+                params=self._get_auth_params(self.session_id),
+                data=_dump_json(payload),
                 timeout=60
             )
+            if self._note_dead_url(url, response):
+                return {}
+            response.raise_for_status()
+            
+            result = _load_json(response.content)
+            logger.info("Scraped %d elements", len(result.get('data', [])))
+            self._store_response(key, result)
+            return result
+            
+        except Exception as e:
+            logger.error("Browserless scrape error: %s", e)
+            return {}
+    
+    def scrape_iter(self, url: str, selectors: Dict[str, str], wait_for: str = None) -> Iterator[Dict]:
+        """
+        Scrape data using CSS selectors, yielding one selector's results at a time
+        Uses Browserless /scrape endpoint
+        
+        With ijson installed the response is parsed as it streams in, so a
+        large result list is never held in memory whole. Not cached.
+        
+        Args:
+            url: Page URL to scrape
+            selectors: Dict mapping names to CSS selectors
+            wait_for: CSS selector to wait for
+        
+        Yields:
+            The entries of scrape()'s 'data' list
+        """
+        try:
+            logger.debug("Scraping (streamed): %.60s...", url)
+            
+            with self._send(
+                'scrape',
+                params=self._get_auth_params(self.session_id),
+                data=_dump_json(self._scrape_payload(url, selectors, wait_for)),
+                timeout=60,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                if ijson is None:
+                    yield from _load_json(response.content).get('data', [])
+                    return
+                
+                # Let urllib3 undo gzip/br while ijson reads the raw stream
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'data.item', use_float=True)
+            
+        except Exception as e:
+            # Reading response.raw bypasses requests' error wrapping, so a
+            # truncated body (ijson/orjson) or a dropped connection (urllib3)
+            # surfaces here too; like scrape(), log it and stop iterating
+            logger.error("Browserless scrape error: %s", e)
+    
+    def execute_function(self, code: str, context: Dict = None, timeout: float = 60) -> Optional[Any]:
+        """
+        Execute custom JavaScript function
+        Uses Browserless /function endpoint
+        
+        Args:
+            code: JavaScript function code
+            context: Optional context data
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Function result or None on error
+        """
+        try:
+            payload = self._function_payload(code, context)
+            
+            response = self._send(
+                'function',
+                params=self._get_auth_params(self.session_id),
+                data=_dump_json(payload),
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return _load_json(response.content)
+            
+        except Exception as e:
+            logger.error("Browserless function error: %s", e)
+            return None
+    
+    # ============================================
+    # BATCHED METHODS
+    # ============================================
+    
+    def get_contents_batched(self, urls: List[str], wait_for: str = None, timeout: int = 30000,
+                             no_cache: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Render several URLs in one /function call on a single remote page
+        
+        Unlike get_many_contents(), which makes one /content call per URL and
+        returns a list in input order, this returns a dict keyed by URL.
+        
+        Args:
+            urls: Page URLs to render
+            wait_for: CSS selector to wait for on every page
+            timeout: Maximum time to wait per page in milliseconds
+            no_cache: Always render, skipping the response cache
+        
+        Returns:
+            Dict mapping each URL to its rendered HTML, or None on error
+        """
+        results, keys, missing = self._split_cached(
+            'content', {url: self._content_payload(url, wait_for, timeout) for url in urls}, no_cache
+        )
+        if len(missing) == 1:
+            results[missing[0]] = self.get_content(missing[0], wait_for, timeout, no_cache)
+        elif missing:
+            logger.debug("Fetching %d pages in one session...", len(missing))
+            fetched = self.execute_function(
+                self.CONTENT_MANY_CODE,
+                {'urls': missing, 'waitFor': wait_for, 'timeout': timeout},
+                timeout=len(missing) * (timeout // 1000) + 10
+            )
+            self._merge_batch(results, keys, missing, fetched)
+        return results
+    
+    def scrape_batched(self, urls: List[str], selectors: Dict[str, str], wait_for: str = None,
+                       no_cache: bool = False) -> Dict[str, Optional[Dict]]:
+        """
+        Scrape several URLs with the same selectors in one /function call
+        
+        Args:
+            urls: Page URLs to scrape
+            selectors: Dict mapping names to CSS selectors
+            wait_for: CSS selector to wait for on every page
+            no_cache: Always scrape, skipping the response cache
+        
+        Returns:
+            Dict mapping each URL to what scrape() returns for it, or None on error
+        """
+        results, keys, missing = self._split_cached(
+            'scrape', {url: self._scrape_payload(url, selectors, wait_for) for url in urls}, no_cache
+        )
+        if len(missing) == 1:
+            results[missing[0]] = self.scrape(missing[0], selectors, wait_for, no_cache) or None
+        elif missing:
+            logger.debug("Scraping %d pages in one session...", len(missing))
+            elements = self._scrape_payload('', selectors)['elements']
+            fetched = self.execute_function(
+                self.SCRAPE_MANY_CODE,
+                {'urls': missing, 'elements': elements, 'waitFor': wait_for},
+                timeout=len(missing) * 30 + 10
+            )
+            self._merge_batch(results, keys, missing, fetched)
+        return results
+    
+    # ============================================
+    # FILE DOWNLOADS
+    # ============================================
+    
+    def _download(self, endpoint: str, payload: Dict, target, timeout: float = 60) -> int:
+        """Stream a binary Browserless response into target and return bytes written"""
+        with self._send(
+            endpoint,
+            params=self._get_auth_params(self.session_id),
+            headers=self.binary_headers,
+            data=_dump_json(payload),
+            timeout=timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            written = 0
+            with self._output_file(target) as f:
+                for chunk in response.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+            return written
+    
+    def get_screenshot_to_file(self, url: str, target, full_page: bool = False,
+                               width: int = 1920, height: int = 1080) -> Optional[int]:
+        """
+        Take a screenshot of a page and write it straight to disk
+        
+        Args:
+            url: Page URL to capture
+            target: File path or binary file object to write the PNG to
+            full_page: Capture entire page height
+            width: Viewport width
+            height: Viewport height
+        
+        Returns:
+            Bytes written or None on error
+        """
+        try:
+            logger.debug("Saving screenshot: %.60s...", url)
+            
+            written = self._download(
+                'screenshot', self._screenshot_payload(url, full_page, width, height), target
+            )
+            
+            logger.info("Screenshot saved: %d bytes", written)
+            return written
+            
+        except Exception as e:
+            logger.error("Browserless screenshot error: %s", e)
+            return None
+    
+    def get_pdf_to_file(self, url: str, target, format: str = 'A4') -> Optional[int]:
+        """
+        Generate a PDF from a URL and write it straight to disk
+        
+        Args:
+            url: Page URL to convert
+            target: File path or binary file object to write the PDF to
+            format: Paper format (A4, Letter, etc.)
+        
+        Returns:
+            Bytes written or None on error
+        """
+        try:
+            logger.debug("Saving PDF: %.60s...", url)
+            
+            written = self._download('pdf', self._pdf_payload(url, format), target)
+            
+            logger.info("PDF saved: %d bytes", written)
+            return written
+            
+        except Exception as e:
+            logger.error("Browserless PDF error: %s", e)
+            return None
+
+
+class AsyncBrowserlessClient(BaseBrowserlessClient):
+    """
+    Async Browserless.io API Client
+    
+    Same endpoints as BrowserlessClient, but requests go through one shared
+    httpx.AsyncClient, so calls never block the event loop and reuse pooled
+    HTTP/2 connections (no TCP + TLS handshake per call).
+    
+    Calls can also be spread over a pool of Browserless sessions kept
+    alive between requests, so most calls skip the remote Chrome cold
+    start. Each session serves one call at a time and is replaced after
+    session_max_uses calls. Pooled sessions keep cookies and page state
+    across every caller of the client, so the pool is off unless
+    session_pool_size (or BROWSERLESS_SESSION_POOL) is set; only enable it
+    for a client that serves a single scrape job.
+    
+    At most max_concurrency calls are in flight at once, whatever the rate
+    limit allows, since Browserless plans cap concurrent browsers.
+    """
+    
+    # Fail fast when the Browserless edge is unreachable; per-call timeouts
+    # only stretch the read side, which covers page rendering
+    CONNECT_TIMEOUT = 10.0
+    
+    def __init__(self, api_key: str = None, requests_per_second: float = None, burst: int = None,
+                 session_pool_size: int = None, session_max_uses: int = 100,
+                 max_concurrency: int = None):
+        super().__init__(api_key, requests_per_second, burst)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        if max_concurrency is None:
+            max_concurrency = int(os.environ.get('BROWSERLESS_MAX_CONCURRENCY', '5'))
+        self.max_concurrency = max_concurrency
+        self._slots: Optional[asyncio.Semaphore] = None
+        
+        if session_pool_size is None:
+            session_pool_size = int(os.environ.get('BROWSERLESS_SESSION_POOL', '0'))
+        if session_pool_size > 0:
+            # Fewer sessions than concurrency slots would leave slots waiting on the pool
+            session_pool_size = max(session_pool_size, self.max_concurrency)
+        self.session_pool_size = session_pool_size
+        self.session_max_uses = session_max_uses
+        self._sessions: Optional[asyncio.Queue] = None
+        self._session_uses: Dict[str, int] = {}
+        
+        # Calls currently running, by response cache key; identical calls
+        # arriving before the first finishes share its result
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
+        # Fire-and-forget work (session DELETEs, Redis writes); the event loop
+        # only keeps weak references to tasks, so they are held here until done
+        self._background: set = set()
+        
+        self._redis = None
+        self._global_limiter = None
+        if self.redis_url:
+            self._redis = redis.asyncio.Redis.from_url(self.redis_url)
+            self._global_limiter = self._redis.register_script(self.GLOBAL_RATE_LIMIT_SCRIPT)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 connection pool, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                timeout=httpx.Timeout(60.0, connect=self.CONNECT_TIMEOUT),
+                # Never open more connections than calls allowed in flight
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_concurrency,
+                    max_connections=self.max_concurrency
+                )
+            )
+        return self._client
+    
+    def _concurrency_slots(self) -> asyncio.Semaphore:
+        """Limiter for in-flight calls, created on first use inside the event loop"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.aclose()
+    
+    def _in_background(self, coro) -> None:
+        """Run coro without waiting for it; aclose() waits for it instead"""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def aclose(self):
+        """End pooled browser sessions and close pooled connections"""
+        # Let pending Redis writes and session DELETEs finish while the
+        # connections they use are still open
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        
+        if self._sessions is not None:
+            while not self._sessions.empty():
+                await self._close_session(self._sessions.get_nowait())
+            self._sessions = None
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+            self._global_limiter = None
+    
+    # ============================================
+    # BROWSER SESSION POOL
+    # ============================================
+    
+    def _session_pool(self) -> asyncio.Queue:
+        """Pool of warm session ids, created on first use inside the event loop"""
+        if self._sessions is None:
+            self._sessions = asyncio.Queue()
+            for _ in range(self.session_pool_size):
+                self._sessions.put_nowait(self._new_session_id())
+        return self._sessions
+    
+    async def _close_session(self, session_id: str):
+        """Ask Browserless to release a session's Chrome process"""
+        self._session_uses.pop(session_id, None)
+        try:
+            await self.client.delete(
+                f"{self.api_url}/session/{session_id}",
+                params=self._get_auth_params(),
+                timeout=10
+            )
+        except httpx.HTTPError:
+            pass  # Browserless expires it after keepalive anyway
+    
+    @asynccontextmanager
+    async def _session(self):
+        """Check out a session id for one call (None if pooling is disabled)"""
+        if self.session_pool_size <= 0:
+            yield None
+            return
+        
+        pool = self._session_pool()
+        session_id = await pool.get()
+        try:
+            yield session_id
+        finally:
+            uses = self._session_uses.get(session_id, 0) + 1
+            if uses >= self.session_max_uses:
+                # Recycle so one long-lived Chrome doesn't accumulate state
+                self._in_background(self._close_session(session_id))
+                session_id = self._new_session_id()
+                uses = 0
+            self._session_uses[session_id] = uses
+            pool.put_nowait(session_id)
+    
+    async def _single_flight(self, key: Optional[tuple], fetch):
+        """Await fetch() once per key; concurrent callers with the same key share the result"""
+        if key is None:
+            return await fetch()
+        
+        # No await between lookup and insert, so this is race-free on the event loop
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one caller being cancelled doesn't cancel the others' call
+        return await asyncio.shield(task)
+    
+    async def _lookup_response(self, key: Optional[tuple]):
+        """Return the cached result for a key from this process or Redis, or None"""
+        value = self._cached_response(key)
+        if value is not None or key is None or self._redis is None:
+            return value
+        
+        try:
+            blob = await self._redis.get(self._redis_cache_key(key))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+            return None
+        if blob is None:
+            return None
+        
+        value = self._decode_cached(blob)
+        self._cache.set(key, value)
+        return value
+    
+    def _store_response(self, key: Optional[tuple], value):
+        """Cache a successful, non-empty result here, and in Redis in the background"""
+        super()._store_response(key, value)
+        if key is not None and value and self._redis is not None:
+            self._in_background(self._redis_store(key, value))
+    
+    async def _redis_store(self, key: tuple, value):
+        """Write one result to the Redis cache"""
+        try:
+            await self._redis.setex(self._redis_cache_key(key), int(self._cache.ttl), self._encode_cached(value))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+    
+    async def ainvalidate(self, url: str) -> int:
+        """Drop every cached response for a URL, here and in Redis"""
+        dropped = self.invalidate(url)
+        if self._redis is not None:
+            try:
+                keys = [key async for key in self._redis.scan_iter(match=self._redis_url_prefix(url) + '*')]
+                if keys:
+                    dropped += await self._redis.delete(*keys)
+            except redis.RedisError as e:
+                logger.warning("Redis cache unavailable: %s", e)
+        return dropped
+    
+    async def _rate_limit(self):
+        """Implement rate limiting between requests without blocking the loop"""
+        if self._global_limiter is not None:
+            try:
+                while True:
+                    wait_ms = await self._global_limiter(keys=[self.rate_limit_key],
+                                                         args=self._global_rate_limit_args())
+                    if not wait_ms:
+                        return
+                    await asyncio.sleep(wait_ms / 1000)
+            except redis.RedisError as e:
+                logger.warning("Redis rate limiter unavailable, using local limit: %s", e)
+        
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    async def _send(self, endpoint: str, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """Send a request, retrying transient failures with jittered backoff"""
+        attempts = 1 if endpoint == 'function' else self.RETRY_ATTEMPTS
+        for attempt in range(1, attempts + 1):
+            # Every attempt takes a token, so retries respect the rate limit
+            await self._rate_limit()
+            try:
+                response = await self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if attempt == attempts:
+                    raise
+                delay = self._retry_delay(attempt)
+                reason = type(e).__name__
+            else:
+                if attempt == attempts or response.status_code not in self.RETRY_STATUSES:
+                    return response
+                delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                reason = f"HTTP {response.status_code}"
+                await response.aclose()
+            
+            logger.warning("Browserless /%s %s; retry %d/%d in %.1fs",
+                           endpoint, reason, attempt, attempts - 1, delay)
+            await asyncio.sleep(delay)
+    
+    def _build_request(self, endpoint: str, payload: Dict, timeout: float,
+                       session_id: Optional[str]) -> httpx.Request:
+        """Build a POST to a Browserless endpoint"""
+        return self.client.build_request(
+            'POST',
+            self._endpoints[endpoint],
+            params=self._get_auth_params(session_id),
+            headers=self.binary_headers if endpoint in ('screenshot', 'pdf') else None,
+            content=_dump_json(payload),
+            timeout=httpx.Timeout(timeout, connect=self.CONNECT_TIMEOUT)
+        )
+    
+    async def _post(self, endpoint: str, payload: Dict, timeout: float = 60) -> httpx.Response:
+        """POST a payload to a Browserless endpoint and raise on HTTP errors"""
+        async with self._concurrency_slots(), self._session() as session_id:
+            response = await self._send(
+                endpoint, self._build_request(endpoint, payload, timeout, session_id)
+            )
+        if endpoint != 'function':
+            self._note_dead_url(payload['url'], response)
+        response.raise_for_status()
+        return response
+    
+    async def _open_stream(self, endpoint: str, payload: Dict, timeout: float = 60) -> httpx.Response:
+        """
+        POST a payload and return the response with its body still unread
+        
+        The caller must iterate the body (e.g. aiter_bytes) and then close
+        it with aclose(), which returns the connection to the pool.
+        """
+        async with self._concurrency_slots(), self._session() as session_id:
+            # Browserless sends headers once rendering is done, so the
+            # session is free again while the body is relayed
+            response = await self._send(
+                endpoint, self._build_request(endpoint, payload, timeout, session_id), stream=True
+            )
+        if response.is_error:
+            await response.aclose()
             response.raise_for_status()
-            
-            print(f"  ✓ Screenshot captured: {len(response.content)} bytes")
-            return response.content
-            
-        except Exception as e:
-            print(f"  ❌ Browserless screenshot error: {e}")
+        return response
+    
+    # ============================================
+    # CORE BROWSERLESS METHODS
+    # ============================================
+    
+    async def get_content(self, url: str, wait_for: str = None, timeout: int = 30000,
+                          no_cache: bool = False) -> Optional[str]:
+        """Get rendered HTML content from a URL (see BrowserlessClient.get_content)"""
+        payload = self._content_payload(url, wait_for, timeout)
+        key = self._response_key('content', payload, no_cache)
+        if self._is_dead_url(url):
             return None
+        
+        cached = await self._lookup_response(key)
+        if cached is not None:
+            logger.debug("Cached content: %.60s", url)
+            return cached
+        
+        async def fetch():
+            try:
+                logger.debug("Fetching content: %.60s...", url)
+                
+                response = await self._post('content', payload, timeout // 1000 + 10)
+                if self._dead_urls.get(url):
+                    return None
+                
+                logger.info("Content received: %d bytes", len(response.text))
+                self._store_response(key, response.text)
+                return response.text
+                
+            except httpx.TimeoutException:
+                logger.error("Timeout fetching: %s", url)
+                return None
+            except httpx.HTTPError as e:
+                logger.error("Browserless content error: %s", e)
+                return None
+        
+        return await self._single_flight(key, fetch)
     
-    def get_pdf(self, url: str, format: str = 'A4') -> Optional[bytes]:
+    async def get_many_contents(self, urls: List[str], wait_for: str = None,
+                                timeout: int = 30000, max_concurrency: int = 5) -> List[Optional[str]]:
         """
-        Generate PDF from a URL
-        Uses Browserless /pdf endpoint
+        Render several URLs concurrently
         
         Args:
-            url: Page URL to convert
-            format: Paper format (A4, Letter, etc.)
+            urls: Page URLs to render
+            wait_for: CSS selector to wait for on every page
+            timeout: Maximum time to wait per page in milliseconds
+            max_concurrency: Most renders in flight at once
         
         Returns:
-            PDF bytes or None on error
+            Rendered HTML (or None on error) for each URL, in input order
         """
-        self._rate_limit()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.get_content(url, wait_for, timeout)
         
+        return await asyncio.gather(*(fetch(url) for url in urls))
+    
+    async def get_screenshot(self, url: str, full_page: bool = False,
+                             width: int = 1920, height: int = 1080) -> Optional[bytes]:
+        """Take screenshot of a page (see BrowserlessClient.get_screenshot)"""
         try:
-            endpoint = f"{self.api_url}/pdf"
-            
-            payload = {
-                'url': url,
-                'options': {
-                    'format': format,
-                    'printBackground': True,
-                    'margin': {
-                        'top': '1cm',
-                        'right': '1cm',
-                        'bottom': '1cm',
-                        'left': '1cm'
-                    }
-                },
-                'gotoOptions': {
-                    'waitUntil': 'networkidle2'
-                }
-            }
-            
-            print(f"  📑 Generating PDF: {url[:60]}...")
+            logger.debug("Taking screenshot: %.60s...", url)
             
-            response = requests.post(
-                endpoint,
-                params=self._get_auth_params(),
-                headers=self.headers,
-                json=payload,
-                timeout=60
+            response = await self._post(
+                'screenshot', self._screenshot_payload(url, full_page, width, height)
             )
-            response.raise_for_status()
             
-            print(f"  ✓ PDF generated: {len(response.content)} bytes")
+            logger.info("Screenshot captured: %d bytes", len(response.content))
             return response.content
             
         except Exception as e:
-            print(f"  ❌ Browserless PDF error: {e}")
+            logger.error("Browserless screenshot error: %s", e)
             return None
     
-    def scrape(self, url: str, selectors: Dict[str, str], wait_for: str = None) -> Dict:
+    async def get_pdf(self, url: str, format: str = 'A4', no_cache: bool = False) -> Optional[bytes]:
+        """Generate PDF from a URL (see BrowserlessClient.get_pdf)"""
+        payload = self._pdf_payload(url, format)
+        key = self._response_key('pdf', payload, no_cache)
+        if self._is_dead_url(url):
+            return None
+        
+        cached = await self._lookup_response(key)
+        if cached is not None:
+            logger.debug("Cached PDF: %.60s", url)
+            return cached
+        
+        async def fetch():
+            try:
+                logger.debug("Generating PDF: %.60s...", url)
+                
+                response = await self._post('pdf', payload)
+                if self._dead_urls.get(url):
+                    return None
+                
+                logger.info("PDF generated: %d bytes", len(response.content))
+                self._store_response(key, response.content)
+                return response.content
+                
+            except Exception as e:
+                logger.error("Browserless PDF error: %s", e)
+                return None
+        
+        return await self._single_flight(key, fetch)
+    
+    async def stream_screenshot(self, url: str, full_page: bool = False,
+                                width: int = 1920, height: int = 1080) -> httpx.Response:
         """
-        Scrape data using CSS selectors
-        Uses Browserless /scrape endpoint
+        Start a screenshot and return the unread upstream response
         
-        Args:
-            url: Page URL to scrape
-            selectors: Dict mapping names to CSS selectors
-            wait_for: CSS selector to wait for
+        Lets the image be relayed chunk by chunk instead of buffered in memory.
+        Raises httpx.HTTPError if Browserless rejects the request.
+        """
+        logger.debug("Streaming screenshot: %.60s...", url)
+        return await self._open_stream(
+            'screenshot', self._screenshot_payload(url, full_page, width, height)
+        )
+    
+    async def stream_pdf(self, url: str, format: str = 'A4') -> httpx.Response:
+        """
+        Start a PDF render and return the unread upstream response
         
-        Returns:
-            Dict of scraped data
+        Raises httpx.HTTPError if Browserless rejects the request.
         """
-        self._rate_limit()
+        logger.debug("Streaming PDF: %.60s...", url)
+        return await self._open_stream('pdf', self._pdf_payload(url, format))
+    
+    async def scrape(self, url: str, selectors: Dict[str, str], wait_for: str = None,
+                     no_cache: bool = False) -> Dict:
+        """Scrape data using CSS selectors (see BrowserlessClient.scrape)"""
+        payload = self._scrape_payload(url, selectors, wait_for)
+        key = self._response_key('scrape', payload, no_cache)
+        if self._is_dead_url(url):
+            return {}
+        
+        cached = await self._lookup_response(key)
+        if cached is not None:
+            logger.debug("Cached scrape: %.60s", url)
+            return cached
+        
+        async def fetch():
+            try:
+                logger.debug("Scraping: %.60s...", url)
+                
+                response = await self._post('scrape', payload)
+                if self._dead_urls.get(url):
+                    return {}
+                
+                result = _load_json(response.content)
+                logger.info("Scraped %d elements", len(result.get('data', [])))
+                self._store_response(key, result)
+                return result
+                
+            except Exception as e:
+                logger.error("Browserless scrape error: %s", e)
+                return {}
         
+        return await self._single_flight(key, fetch)
+    
+    async def execute_function(self, code: str, context: Dict = None,
+                               timeout: float = 60) -> Optional[Any]:
+        """Execute custom JavaScript function (see BrowserlessClient.execute_function)"""
         try:
-            endpoint = f"{self.api_url}/scrape"
-            
-            elements = [
-                {'selector': selector, 'name': name}
-                for name, selector in selectors.items()
-            ]
+            response = await self._post('function', self._function_payload(code, context), timeout)
+            return _load_json(response.content)
             
-            payload = {
-                'url': url,
-                'elements': elements,
-                'gotoOptions': {
-                    'waitUntil': 'networkidle2'
-                }
-            }
-            
-            if wait_for:
-                payload['waitForSelector'] = {'selector': wait_for}
-            
-            print(f"  🔍 Scraping: {url[:60]}...")
+        except Exception as e:
+            logger.error("Browserless function error: %s", e)
+            return None
+    
+    # ============================================
+    # BATCHED METHODS
+    # ============================================
+    
+    async def get_contents_batched(self, urls: List[str], wait_for: str = None, timeout: int = 30000,
+                                   no_cache: bool = False) -> Dict[str, Optional[str]]:
+        """Render several URLs in one /function call (see BrowserlessClient.get_contents_batched)"""
+        results, keys, missing = self._split_cached(
+            'content', {url: self._content_payload(url, wait_for, timeout) for url in urls}, no_cache
+        )
+        if len(missing) == 1:
+            results[missing[0]] = await self.get_content(missing[0], wait_for, timeout, no_cache)
+        elif missing:
+            logger.debug("Fetching %d pages in one session...", len(missing))
+            fetched = await self.execute_function(
+                self.CONTENT_MANY_CODE,
+                {'urls': missing, 'waitFor': wait_for, 'timeout': timeout},
+                timeout=len(missing) * (timeout // 1000) + 10
+            )
+            self._merge_batch(results, keys, missing, fetched)
+        return results
+    
+    async def scrape_batched(self, urls: List[str], selectors: Dict[str, str], wait_for: str = None,
+                             no_cache: bool = False) -> Dict[str, Optional[Dict]]:
+        """Scrape several URLs in one /function call (see BrowserlessClient.scrape_batched)"""
+        results, keys, missing = self._split_cached(
+            'scrape', {url: self._scrape_payload(url, selectors, wait_for) for url in urls}, no_cache
+        )
+        if len(missing) == 1:
+            results[missing[0]] = await self.scrape(missing[0], selectors, wait_for, no_cache) or None
+        elif missing:
+            logger.debug("Scraping %d pages in one session...", len(missing))
+            elements = self._scrape_payload('', selectors)['elements']
+            fetched = await self.execute_function(
+                self.SCRAPE_MANY_CODE,
+                {'urls': missing, 'elements': elements, 'waitFor': wait_for},
+                timeout=len(missing) * 30 + 10
+            )
+            self._merge_batch(results, keys, missing, fetched)
+        return results
+    
+    # ============================================
+    # FILE DOWNLOADS
+    # ============================================
+    
+    async def _download(self, endpoint: str, payload: Dict, target, timeout: float = 60) -> int:
+        """Stream a binary Browserless response into target and return bytes written"""
+        response = await self._open_stream(endpoint, payload, timeout)
+        try:
+            written = 0
+            with self._output_file(target) as f:
+                async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+            return written
+        finally:
+            await response.aclose()
+    
+    async def get_screenshot_to_file(self, url: str, target, full_page: bool = False,
+                                     width: int = 1920, height: int = 1080) -> Optional[int]:
+        """Write a page screenshot straight to disk (see BrowserlessClient.get_screenshot_to_file)"""
+        try:
+            logger.debug("Saving screenshot: %.60s...", url)
             
-            response = requests.post(
-                endpoint,
-                params=self._get_auth_params(),
-                headers=self.headers,
-                json=payload,
-                timeout=60
+            written = await self._download(
+                'screenshot', self._screenshot_payload(url, full_page, width, height), target
             )
-            response.raise_for_status()
             
-            result = response.json()
-            print(f"  ✓ Scraped {len(result.get('data', []))} elements")
-            return result
+            logger.info("Screenshot saved: %d bytes", written)
+            return written
             
         except Exception as e:
-            print(f"  ❌ Browserless scrape error: {e}")
-            return {}
+            logger.error("Browserless screenshot error: %s", e)
+            return None
     
-    def execute_function(self, code: str, context: Dict = None) -> Optional[Any]:
-        """
-        Execute custom JavaScript function
-        Uses Browserless /function endpoint
-        
-        Args:
-            code: JavaScript function code
-            context: Optional context data
-        
-        Returns:
-            Function result or None on error
-        """
-        self._rate_limit()
-        
+    async def get_pdf_to_file(self, url: str, target, format: str = 'A4') -> Optional[int]:
+        """Write a page PDF straight to disk (see BrowserlessClient.get_pdf_to_file)"""
         try:
-            endpoint = f"{self.api_url}/function"
+            logger.debug("Saving PDF: %.60s...", url)
             
-            payload = {
-                'code': code
-            }
-            
-            if context:
-                payload['context'] = context
+            written = await self._download('pdf', self._pdf_payload(url, format), target)
             
-            response = requests.post(
-                endpoint,
-                params=self._get_auth_params(),
-                headers=self.headers,
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
-            return response.json()
+            logger.info("PDF saved: %d bytes", written)
+            return written
             
         except Exception as e:
-            print(f"  ❌ Browserless function error: {e}")
+            logger.error("Browserless PDF error: %s", e)
             return None
 
 
+# ============================================
+# RESULT RECORDS
+# ============================================
+
+# Slotted records are about half the size of the equivalent dict; slots=
+# needs Python 3.10, older interpreters get regular dataclasses
+_RECORD_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RECORD_OPTIONS)
+class JobRecord:
+    """One job listing from any of the job boards"""
+    title: str
+    company: str = ''
+    location: str = ''
+    snippet: str = ''
+    salary: str = ''
+    url: str = ''
+    source: str = ''
+
+
+@dataclass(**_RECORD_OPTIONS)
+class ProfileRecord:
+    """One LinkedIn people-search result"""
+    name: str
+    headline: str = ''
+    location: str = ''
+    profile_url: str = ''
+    source: str = 'linkedin_browserless'
+
+
+@dataclass(**_RECORD_OPTIONS)
+class ResumeRecord:
+    """One Indeed resume search result"""
+    name: str = ''
+    title: str = ''
+    location: str = ''
+    source: str = 'indeed_resumes_browserless'
+
+
+# What one job source returns: listings, or people results for 'linkedin'
+SourceRecord = Union[JobRecord, ProfileRecord]
+
+
+# ============================================
+# PARSE WORKERS
+# ============================================
+
+# Processes the async scrapers parse pages on; 0 parses on the event loop.
+# Under Gunicorn each worker already has a core to itself, so this is for
+# single-process deployments rendering many pages at once
+SCRAPER_PARSE_WORKERS = int(os.environ.get('SCRAPER_PARSE_WORKERS', '0'))
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Start the parse worker pool on first use"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=SCRAPER_PARSE_WORKERS)
+        return _parse_pool
+
+
+async def _parse_off_loop(parse, *args):
+    """
+    Run a scraper's page parser on the parse worker pool
+    
+    parse must be a module-level function or staticmethod so it pickles;
+    runs inline when SCRAPER_PARSE_WORKERS is 0.
+    """
+    if SCRAPER_PARSE_WORKERS <= 0:
+        return parse(*args)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_parse_pool(), parse, *args)
+
+
 # ============================================
 # INTEGRATED SCRAPER SERVICES
 # ============================================
@@ -360,153 +1908,202 @@ class BrowserlessClient:
 class BrowserlessLinkedInScraper:
     """LinkedIn scraper using Browserless.io"""
     
-    def __init__(self, browserless: BrowserlessClient):
+    __slots__ = ('client', 'async_client')
+    
+    def __init__(self, browserless: BrowserlessClient,
+                 async_browserless: AsyncBrowserlessClient = None):
         self.client = browserless
+        self.async_client = async_browserless
     
-    def search_profiles(self, keywords: str, location: str = "") -> List[Dict]:
+    def search_profiles(self, keywords: str, location: str = "") -> List[ProfileRecord]:
         """Search LinkedIn profiles (public search only)"""
-        print(f"\n🔗 LinkedIn Search: {keywords}")
+        logger.info("LinkedIn Search: %s", keywords)
         
+        html = self.client.get_content(
+            self._search_url(keywords, location), wait_for='.search-results-container', timeout=45000
+        )
+        return self._parse_profiles(html)
+    
+    async def search_profiles_async(self, keywords: str, location: str = "") -> List[ProfileRecord]:
+        """Search LinkedIn profiles without blocking the event loop"""
+        logger.info("LinkedIn Search: %s", keywords)
+        
+        html = await self.async_client.get_content(
+            self._search_url(keywords, location), wait_for='.search-results-container', timeout=45000
+        )
+        return await _parse_off_loop(self._parse_profiles, html)
+    
+    @staticmethod
+    def _search_url(keywords: str, location: str = "") -> str:
+        """Build the people search URL"""
         # URL encode keywords
-        from urllib.parse import quote
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote(keywords)}"
+        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(keywords)}"
         if location:
-            search_url += f"&location={quote(location)}"
-        
-        html = self.client.get_content(search_url, wait_for='.search-results-container', timeout=45000)
-        if not html:
+            search_url += f"&location={quote_plus(location)}"
+        return search_url
+    
+    @staticmethod
+    def _parse_profiles(html: Optional[str]) -> List[ProfileRecord]:
+        """Extract profile cards from a rendered search page"""
+        if not _has_markers(html, ('entity-result__item', 'reusable-search__result-container', 'search-result')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html, only_classes=('entity-result__item', 'reusable-search__result-container', 'search-result'))
         profiles = []
         
         # Try multiple selector patterns
-        cards = soup.select('.entity-result__item, .reusable-search__result-container, .search-result')
+        cards = tree.css('.entity-result__item, .reusable-search__result-container, .search-result')
         
         for card in cards[:20]:
             try:
-                name_elem = card.select_one('.entity-result__title-text a, .actor-name, h3 a')
-                headline_elem = card.select_one('.entity-result__primary-subtitle, .subline-level-1')
-                location_elem = card.select_one('.entity-result__secondary-subtitle, .subline-level-2')
+                name_elem = card.css_first('.entity-result__title-text a, .actor-name, h3 a')
+                headline_elem = card.css_first('.entity-result__primary-subtitle, .subline-level-1')
+                location_elem = card.css_first('.entity-result__secondary-subtitle, .subline-level-2')
                 
-                name = name_elem.get_text(strip=True) if name_elem else ''
+                name = name_elem.text(strip=True) if name_elem else ''
                 if not name:
                     continue
                     
-                profiles.append({
-                    'name': name,
-                    'headline': headline_elem.get_text(strip=True) if headline_elem else '',
-                    'location': location_elem.get_text(strip=True) if location_elem else '',
-                    'profile_url': name_elem.get('href', '') if name_elem else '',
-                    'source': 'linkedin_browserless'
-                })
+                profiles.append(ProfileRecord(
+                    name=name,
+                    headline=headline_elem.text(strip=True) if headline_elem else '',
+                    location=location_elem.text(strip=True) if location_elem else '',
+                    profile_url=(name_elem.attributes.get('href') or '') if name_elem else ''
+                ))
             except Exception as e:
                 continue
         
-        print(f"  Found {len(profiles)} LinkedIn profiles")
+        logger.info("Found %d LinkedIn profiles", len(profiles))
         return profiles
 
 
 class BrowserlessIndeedScraper:
     """Indeed job scraper using Browserless.io"""
     
-    def __init__(self, browserless: BrowserlessClient):
+    __slots__ = ('client', 'async_client')
+    
+    JOBS_WAIT_FOR = '.jobsearch-ResultsList, .mosaic-provider-jobcards'
+    
+    def __init__(self, browserless: BrowserlessClient,
+                 async_browserless: AsyncBrowserlessClient = None):
         self.client = browserless
+        self.async_client = async_browserless
     
-    def search_jobs(self, keywords: str, location: str = "", remote: bool = False) -> List[Dict]:
+    def search_jobs(self, keywords: str, location: str = "", remote: bool = False) -> List[JobRecord]:
         """Search Indeed for jobs"""
-        print(f"\n💼 Indeed Search: {keywords} in {location or 'all locations'}")
+        logger.info("Indeed Search: %s in %s", keywords, location or 'all locations')
         
-        from urllib.parse import quote
-        search_url = f"https://www.indeed.com/jobs?q={quote(keywords)}&l={quote(location)}"
+        html = self.client.get_content(
+            self._jobs_url(keywords, location, remote), wait_for=self.JOBS_WAIT_FOR
+        )
+        return self._parse_jobs(html)
+    
+    async def search_jobs_async(self, keywords: str, location: str = "", remote: bool = False) -> List[JobRecord]:
+        """Search Indeed for jobs without blocking the event loop"""
+        logger.info("Indeed Search: %s in %s", keywords, location or 'all locations')
+        
+        html = await self.async_client.get_content(
+            self._jobs_url(keywords, location, remote), wait_for=self.JOBS_WAIT_FOR
+        )
+        return await _parse_off_loop(self._parse_jobs, html)
+    
+    @staticmethod
+    def _jobs_url(keywords: str, location: str = "", remote: bool = False) -> str:
+        """Build the job search URL"""
+        search_url = f"https://www.indeed.com/jobs?q={quote_plus(keywords)}&l={quote_plus(location)}"
         if remote:
             search_url += "&remotejob=032b3046-06a3-4876-8dfd-474eb5e7ed11"
-        
-        html = self.client.get_content(search_url, wait_for='.jobsearch-ResultsList, .mosaic-provider-jobcards')
-        if not html:
+        return search_url
+    
+    @staticmethod
+    def _parse_jobs(html: Optional[str]) -> List[JobRecord]:
+        """Extract job cards from a rendered search page"""
+        if not _has_markers(html, ('job_seen_beacon', 'resultContent', 'jobCard_mainContent', 'data-jk')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html)
         jobs = []
         
         # Multiple selector patterns for Indeed's changing layout
-        cards = soup.select('.job_seen_beacon, .resultContent, .jobCard_mainContent, [data-jk]')
+        cards = tree.css('.job_seen_beacon, .resultContent, .jobCard_mainContent, [data-jk]')
         
         for card in cards[:25]:
             try:
-                title_elem = card.select_one('.jobTitle a, h2.jobTitle span, [data-testid="job-title"]')
-                company_elem = card.select_one('.companyName, [data-testid="company-name"], .company')
-                location_elem = card.select_one('.companyLocation, [data-testid="text-location"], .location')
-                snippet_elem = card.select_one('.job-snippet, .underShelfFooter, .jobCardShelfContainer')
-                salary_elem = card.select_one('.salary-snippet, [data-testid="attribute_snippet_testid"]')
+                title_elem = card.css_first('.jobTitle a, h2.jobTitle span, [data-testid="job-title"]')
+                company_elem = card.css_first('.companyName, [data-testid="company-name"], .company')
+                location_elem = card.css_first('.companyLocation, [data-testid="text-location"], .location')
+                snippet_elem = card.css_first('.job-snippet, .underShelfFooter, .jobCardShelfContainer')
+                salary_elem = card.css_first('.salary-snippet, [data-testid="attribute_snippet_testid"]')
                 
-                title = title_elem.get_text(strip=True) if title_elem else ''
+                title = title_elem.text(strip=True) if title_elem else ''
                 if not title:
                     continue
                 
                 # Get job URL
-                link = card.select_one('a[href*="/rc/clk"], a[data-jk], .jobTitle a')
+                link = card.css_first('a[href*="/rc/clk"], a[data-jk], .jobTitle a')
                 job_url = ''
                 if link:
-                    href = link.get('href', '')
+                    href = link.attributes.get('href') or ''
                     if href.startswith('/'):
                         job_url = f"https://www.indeed.com{href}"
                     else:
                         job_url = href
                 
-                jobs.append({
-                    'title': title,
-                    'company': company_elem.get_text(strip=True) if company_elem else '',
-                    'location': location_elem.get_text(strip=True) if location_elem else '',
-                    'snippet': snippet_elem.get_text(strip=True)[:200] if snippet_elem else '',
-                    'salary': salary_elem.get_text(strip=True) if salary_elem else '',
-                    'url': job_url,
-                    'source': 'indeed_browserless'
-                })
+                jobs.append(JobRecord(
+                    title=title,
+                    company=company_elem.text(strip=True) if company_elem else '',
+                    location=location_elem.text(strip=True) if location_elem else '',
+                    snippet=snippet_elem.text(strip=True)[:200] if snippet_elem else '',
+                    salary=salary_elem.text(strip=True) if salary_elem else '',
+                    url=job_url,
+                    source='indeed_browserless'
+                ))
             except Exception:
                 continue
         
-        print(f"  Found {len(jobs)} Indeed jobs")
+        logger.info("Found %d Indeed jobs", len(jobs))
         return jobs
     
-    def search_resumes(self, keywords: str, location: str = "") -> List[Dict]:
+    def search_resumes(self, keywords: str, location: str = "") -> List[ResumeRecord]:
         """Search Indeed resume database"""
-        print(f"\n📝 Indeed Resume Search: {keywords}")
+        logger.info("Indeed Resume Search: %s", keywords)
         
-        from urllib.parse import quote
-        search_url = f"https://www.indeed.com/resumes?q={quote(keywords)}&l={quote(location)}"
+        search_url = f"https://www.indeed.com/resumes?q={quote_plus(keywords)}&l={quote_plus(location)}"
         
         html = self.client.get_content(search_url)
-        if not html:
+        if not _has_markers(html, ('resMosaic-card', 'resume-card')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html, only_classes=('resMosaic-card', 'resume-card'))
         resumes = []
         
-        cards = soup.select('.resMosaic-card, .resume-card')
+        cards = tree.css('.resMosaic-card, .resume-card')
         
         for card in cards[:20]:
             try:
-                name_elem = card.select_one('.resume-name, h2')
-                title_elem = card.select_one('.resume-title, .headline')
-                location_elem = card.select_one('.resume-location, .location')
+                name_elem = card.css_first('.resume-name, h2')
+                title_elem = card.css_first('.resume-title, .headline')
+                location_elem = card.css_first('.resume-location, .location')
                 
-                resumes.append({
-                    'name': name_elem.get_text(strip=True) if name_elem else '',
-                    'title': title_elem.get_text(strip=True) if title_elem else '',
-                    'location': location_elem.get_text(strip=True) if location_elem else '',
-                    'source': 'indeed_resumes_browserless'
-                })
+                resumes.append(ResumeRecord(
+                    name=name_elem.text(strip=True) if name_elem else '',
+                    title=title_elem.text(strip=True) if title_elem else '',
+                    location=location_elem.text(strip=True) if location_elem else ''
+                ))
             except Exception:
                 continue
         
-        print(f"  Found {len(resumes)} Indeed resumes")
+        logger.info("Found %d Indeed resumes", len(resumes))
         return resumes
 
 
 class BrowserlessSpokeoScraper:
     """Enhanced Spokeo scraper using Browserless.io for JavaScript rendering"""
     
+    __slots__ = ('client', 'email', 'password')
+    
+    PHONE_RE = re.compile(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})')
+    
     def __init__(self, browserless: BrowserlessClient, email: str = None, password: str = None):
         self.client = browserless
         self.email = email or os.environ.get('SPOKEO_EMAIL', '')
@@ -514,20 +2111,19 @@ class BrowserlessSpokeoScraper:
     
     def search_address(self, address: str, city: str, state: str = "TX", zipcode: str = None) -> Dict:
         """Search property by address with JS rendering"""
-        print(f"\n🏠 Spokeo Address Search: {address}, {city}")
+        logger.info("Spokeo Address Search: %s, %s", address, city)
         
         full_address = f"{address}, {city}, {state}"
         if zipcode:
             full_address += f" {zipcode}"
         
-        from urllib.parse import quote
-        search_url = f"https://www.spokeo.com/search?q={quote(full_address)}"
+        search_url = f"https://www.spokeo.com/search?q={quote_plus(full_address)}"
         
         html = self.client.get_content(search_url, wait_for='.search-results, .result-card', timeout=45000)
         if not html:
             return {'address': full_address, 'source': 'spokeo_browserless', 'error': 'No content'}
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html)
         
         result = {
             'address': full_address,
@@ -539,51 +2135,50 @@ class BrowserlessSpokeoScraper:
         }
         
         # Extract data from rendered page
-        owner_elem = soup.select_one('.owner-name, .resident-name, [class*="owner"], .name-link')
+        owner_elem = tree.css_first('.owner-name, .resident-name, [class*="owner"], .name-link')
         if owner_elem:
-            result['owner_name'] = owner_elem.get_text(strip=True)
+            result['owner_name'] = owner_elem.text(strip=True)
         
-        phone_elem = soup.select_one('.phone-number, [class*="phone"], a[href^="tel:"]')
+        phone_elem = tree.css_first('.phone-number, [class*="phone"], a[href^="tel:"]')
         if phone_elem:
-            phone_text = phone_elem.get_text(strip=True)
+            phone_text = phone_elem.text(strip=True)
             # Extract phone pattern
-            phone_match = re.search(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', phone_text)
+            phone_match = self.PHONE_RE.search(phone_text)
             if phone_match:
                 result['phone'] = phone_match.group(1)
         
-        email_elem = soup.select_one('[class*="email"], a[href^="mailto:"]')
+        email_elem = tree.css_first('[class*="email"], a[href^="mailto:"]')
         if email_elem:
-            email_text = email_elem.get('href', '').replace('mailto:', '') or email_elem.get_text(strip=True)
+            email_text = (email_elem.attributes.get('href') or '').replace('mailto:', '') or email_elem.text(strip=True)
             if '@' in email_text:
                 result['email'] = email_text
         
-        value_elem = soup.select_one('[class*="value"], [class*="price"]')
+        value_elem = tree.css_first('[class*="value"], [class*="price"]')
         if value_elem:
-            value_text = value_elem.get_text(strip=True)
+            value_text = value_elem.text(strip=True)
             if '$' in value_text:
                 result['property_value'] = value_text
         
-        print(f"  Owner: {result['owner_name'] or 'Not found'}")
+        logger.info("Owner: %s", result['owner_name'] or 'Not found')
         return result
     
     def search_person(self, name: str, city: str = None, state: str = "TX") -> Dict:
         """Search for person by name"""
-        print(f"\n👤 Spokeo Person Search: {name}")
+        logger.info("Spokeo Person Search: %s", name)
         
-        from urllib.parse import quote
         search_parts = [name]
         if city:
             search_parts.append(city)
         if state:
             search_parts.append(state)
         
-        search_url = f"https://www.spokeo.com/search?q={quote(' '.join(search_parts))}"
+        search_url = f"https://www.spokeo.com/search?q={quote_plus(' '.join(search_parts))}"
         
         html = self.client.get_content(search_url, timeout=45000)
         if not html:
             return {'name': name, 'source': 'spokeo_browserless', 'error': 'No content'}
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html)
         
         result = {
             'name': name,
@@ -594,15 +2189,15 @@ class BrowserlessSpokeoScraper:
         }
         
         # Extract addresses
-        for addr in soup.select('[class*="address"]')[:3]:
-            addr_text = addr.get_text(strip=True)
+        for addr in tree.css('[class*="address"]')[:3]:
+            addr_text = addr.text(strip=True)
             if len(addr_text) > 10:
                 result['addresses'].append(addr_text)
         
         # Extract phones
-        for phone in soup.select('[class*="phone"], a[href^="tel:"]')[:3]:
-            phone_text = phone.get_text(strip=True)
-            phone_match = re.search(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', phone_text)
+        for phone in tree.css('[class*="phone"], a[href^="tel:"]')[:3]:
+            phone_text = phone.text(strip=True)
+            phone_match = self.PHONE_RE.search(phone_text)
             if phone_match:
                 result['phones'].append(phone_match.group(1))
         
@@ -612,12 +2207,28 @@ class BrowserlessSpokeoScraper:
 class BrowserlessInstagramScraper:
     """Instagram scraper using Browserless.io"""
     
+    __slots__ = ('client',)
+    
+    # Counts in the og:description, e.g. "1.2M Followers, 300 Following, 50 Posts"
+    FOLLOWERS_RE = re.compile(r'([\d,.]+[KMB]?)\s*Followers', re.I)
+    FOLLOWING_RE = re.compile(r'([\d,.]+[KMB]?)\s*Following', re.I)
+    POSTS_RE = re.compile(r'([\d,.]+[KMB]?)\s*Posts', re.I)
+    COUNT_MULTIPLIERS = {'K': 1000, 'M': 1000000, 'B': 1000000000}
+    
+    # The profile page embeds everything get_profile() reads as JSON-LD and
+    # og: meta tags, so both are pulled from the raw HTML without a DOM tree
+    LD_JSON_RE = re.compile(
+        r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I
+    )
+    META_RE = re.compile(r'<meta\s[^>]*>', re.I)
+    META_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+    
     def __init__(self, browserless: BrowserlessClient):
         self.client = browserless
     
     def get_profile(self, username: str) -> Dict:
         """Get Instagram profile data"""
-        print(f"\n📷 Instagram Profile: @{username}")
+        logger.info("Instagram Profile: @%s", username)
         
         username = username.replace('@', '').strip().lower()
         url = f"https://www.instagram.com/{username}/"
@@ -626,8 +2237,6 @@ class BrowserlessInstagramScraper:
         if not html:
             return {'username': username, 'source': 'instagram_browserless', 'error': 'No content'}
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
         result = {
             'username': username,
             'full_name': '',
@@ -642,235 +2251,331 @@ class BrowserlessInstagramScraper:
         }
         
         # Try to extract JSON-LD data
-        for script in soup.find_all('script', type='application/ld+json'):
+        for blob in self.LD_JSON_RE.findall(html):
             try:
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    result['full_name'] = data.get('name', '')
-                    result['bio'] = data.get('description', '')
-                    result['external_url'] = data.get('url', '')
-            except:
+                data = _load_json(blob)
+            except ValueError:
                 continue
+            if isinstance(data, dict):
+                result['full_name'] = data.get('name', '')
+                result['bio'] = data.get('description', '')
+                result['external_url'] = data.get('url', '')
+                result['followers'] = self._follower_count(data) or result['followers']
         
         # Try meta tags
-        og_title = soup.find('meta', property='og:title')
-        if og_title:
-            title_content = og_title.get('content', '')
+        meta = self._og_meta(html)
+        title_content = meta.get('og:title')
+        if title_content:
             if '•' in title_content:
                 parts = title_content.split('•')
                 if len(parts) >= 1:
                     result['full_name'] = parts[0].strip().replace(f'@{username}', '').strip(' ()')
         
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc:
-            desc = og_desc.get('content', '')
+        desc = meta.get('og:description')
+        if desc:
             # Parse follower counts from description
-            followers_match = re.search(r'([\d,.]+[KMB]?)\s*Followers', desc, re.I)
+            followers_match = self.FOLLOWERS_RE.search(desc)
             if followers_match:
                 result['followers'] = self._parse_count(followers_match.group(1))
             
-            following_match = re.search(r'([\d,.]+[KMB]?)\s*Following', desc, re.I)
+            following_match = self.FOLLOWING_RE.search(desc)
             if following_match:
                 result['following'] = self._parse_count(following_match.group(1))
             
-            posts_match = re.search(r'([\d,.]+[KMB]?)\s*Posts', desc, re.I)
+            posts_match = self.POSTS_RE.search(desc)
             if posts_match:
                 result['posts'] = self._parse_count(posts_match.group(1))
         
-        print(f"  Name: {result['full_name'] or 'Not found'}")
-        print(f"  Followers: {result['followers']:,}")
+        logger.info("Name: %s", result['full_name'] or 'Not found')
+        logger.info("Followers: %d", result['followers'])
         return result
     
+    @staticmethod
+    def _follower_count(data: Dict) -> int:
+        """FollowAction counter from a ProfilePage JSON-LD blob, 0 if absent"""
+        page = data.get('mainEntityofPage') or data
+        stats = page.get('interactionStatistic') if isinstance(page, dict) else None
+        if isinstance(stats, dict):
+            stats = [stats]
+        for stat in stats or ():
+            if isinstance(stat, dict) and str(stat.get('interactionType', '')).endswith('FollowAction'):
+                try:
+                    return int(stat.get('userInteractionCount') or 0)
+                except (TypeError, ValueError):
+                    return 0
+        return 0
+    
+    @classmethod
+    def _og_meta(cls, html: str) -> Dict[str, str]:
+        """Map each og: property to the content of its first meta tag"""
+        meta = {}
+        for tag in cls.META_RE.findall(html):
+            attrs = {
+                name.lower(): double or single
+                for name, double, single in cls.META_ATTR_RE.findall(tag)
+            }
+            prop = attrs.get('property', '')
+            if prop.startswith('og:') and prop not in meta:
+                meta[prop] = html_lib.unescape(attrs.get('content', ''))
+        return meta
+    
     def _parse_count(self, count_str: str) -> int:
         """Parse follower/following count string to int"""
         count_str = count_str.replace(',', '').strip().upper()
-        multiplier = 1
-        
-        if 'K' in count_str:
-            multiplier = 1000
-            count_str = count_str.replace('K', '')
-        elif 'M' in count_str:
-            multiplier = 1000000
-            count_str = count_str.replace('M', '')
-        elif 'B' in count_str:
-            multiplier = 1000000000
-            count_str = count_str.replace('B', '')
+        if not count_str:
+            return 0
+        
+        # The count patterns only allow the suffix as the last character
+        multiplier = self.COUNT_MULTIPLIERS.get(count_str[-1])
+        if multiplier:
+            count_str = count_str[:-1]
+        else:
+            multiplier = 1
         
         try:
             return int(float(count_str) * multiplier)
-        except:
+        except ValueError:
             return 0
 
 
 class BrowserlessJobScraper:
     """Multi-platform job scraper using Browserless.io"""
     
-    def __init__(self, browserless: BrowserlessClient):
+    __slots__ = ('client', 'async_client')
+    
+    WELLFOUND_WAIT_FOR = '[class*="styles_component"], .job-card'
+    
+    def __init__(self, browserless: BrowserlessClient,
+                 async_browserless: AsyncBrowserlessClient = None):
         self.client = browserless
+        self.async_client = async_browserless
     
-    def scrape_remote_co(self, category: str = "developer") -> List[Dict]:
+    def scrape_remote_co(self, category: str = "developer") -> List[JobRecord]:
         """Scrape Remote.co jobs"""
-        print(f"\n🌐 Remote.co Search: {category}")
+        logger.info("Remote.co Search: %s", category)
         
-        url = f"https://remote.co/remote-jobs/{category}/"
-        html = self.client.get_content(url)
-        if not html:
+        html = self.client.get_content(f"https://remote.co/remote-jobs/{category}/")
+        return self._parse_remote_co(html)
+    
+    async def scrape_remote_co_async(self, category: str = "developer") -> List[JobRecord]:
+        """Scrape Remote.co jobs without blocking the event loop"""
+        logger.info("Remote.co Search: %s", category)
+        
+        html = await self.async_client.get_content(f"https://remote.co/remote-jobs/{category}/")
+        return await _parse_off_loop(self._parse_remote_co, html)
+    
+    @staticmethod
+    def _parse_remote_co(html: Optional[str]) -> List[JobRecord]:
+        """Extract Remote.co listings from a rendered page"""
+        if not _has_markers(html, ('job_listing', 'card')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html, only_classes=('job_listing', 'card'))
         jobs = []
         
-        for listing in soup.select('.job_listing, .card')[:20]:
-            title = listing.select_one('.position, .job-title, h3')
-            company = listing.select_one('.company, .company-name')
-            link = listing.select_one('a[href*="job"]')
+        for listing in tree.css('.job_listing, .card')[:20]:
+            title = listing.css_first('.position, .job-title, h3')
+            company = listing.css_first('.company, .company-name')
+            link = listing.css_first('a[href*="job"]')
             
             if not title:
                 continue
             
             job_url = ''
             if link:
-                href = link.get('href', '')
+                href = link.attributes.get('href') or ''
                 if href.startswith('/'):
                     job_url = f"https://remote.co{href}"
                 else:
                     job_url = href
             
-            jobs.append({
-                'title': title.get_text(strip=True),
-                'company': company.get_text(strip=True) if company else '',
-                'url': job_url,
-                'source': 'remote_co'
-            })
-        
-        print(f"  Found {len(jobs)} Remote.co jobs")
+            jobs.append(JobRecord(
+                title=title.text(strip=True),
+                company=company.text(strip=True) if company else '',
+                url=job_url,
+                source='remote_co'
+            ))
+        
+        logger.info("Found %d Remote.co jobs", len(jobs))
         return jobs
     
-    def scrape_wellfound(self, role: str = "ai-automation") -> List[Dict]:
+    def scrape_wellfound(self, role: str = "ai-automation") -> List[JobRecord]:
         """Scrape Wellfound (AngelList) jobs"""
-        print(f"\n🚀 Wellfound Search: {role}")
+        logger.info("Wellfound Search: %s", role)
         
-        url = f"https://wellfound.com/role/l/{role}"
-        html = self.client.get_content(url, wait_for='[class*="styles_component"], .job-card', timeout=45000)
-        if not html:
+        html = self.client.get_content(
+            f"https://wellfound.com/role/l/{role}", wait_for=self.WELLFOUND_WAIT_FOR, timeout=45000
+        )
+        return self._parse_wellfound(html)
+    
+    async def scrape_wellfound_async(self, role: str = "ai-automation") -> List[JobRecord]:
+        """Scrape Wellfound (AngelList) jobs without blocking the event loop"""
+        logger.info("Wellfound Search: %s", role)
+        
+        html = await self.async_client.get_content(
+            f"https://wellfound.com/role/l/{role}", wait_for=self.WELLFOUND_WAIT_FOR, timeout=45000
+        )
+        return await _parse_off_loop(self._parse_wellfound, html)
+    
+    @staticmethod
+    def _parse_wellfound(html: Optional[str]) -> List[JobRecord]:
+        """Extract Wellfound job cards from a rendered page"""
+        if not _has_markers(html, ('JobListingCard', 'styles_component', 'job-card')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html)
         jobs = []
         
-        cards = soup.select('[class*="JobListingCard"], [class*="styles_component"], .job-card, [data-test="job-card"]')
+        cards = tree.css('[class*="JobListingCard"], [class*="styles_component"], .job-card, [data-test="job-card"]')
         
         for card in cards[:20]:
-            title = card.select_one('h2, [class*="title"], .job-title')
-            company = card.select_one('[class*="company"], .startup-name, [class*="CompanyName"]')
-            location = card.select_one('[class*="location"], .job-location')
-            salary = card.select_one('[class*="salary"], [class*="compensation"]')
-            link = card.select_one('a[href*="/jobs/"], a[href*="/company/"]')
+            title = card.css_first('h2, [class*="title"], .job-title')
+            company = card.css_first('[class*="company"], .startup-name, [class*="CompanyName"]')
+            location = card.css_first('[class*="location"], .job-location')
+            salary = card.css_first('[class*="salary"], [class*="compensation"]')
+            link = card.css_first('a[href*="/jobs/"], a[href*="/company/"]')
             
             if not title:
                 continue
             
             job_url = ''
             if link:
-                href = link.get('href', '')
+                href = link.attributes.get('href') or ''
                 if href.startswith('/'):
                     job_url = f"https://wellfound.com{href}"
                 else:
                     job_url = href
             
-            jobs.append({
-                'title': title.get_text(strip=True),
-                'company': company.get_text(strip=True) if company else '',
-                'location': location.get_text(strip=True) if location else '',
-                'salary': salary.get_text(strip=True) if salary else '',
-                'url': job_url,
-                'source': 'wellfound'
-            })
-        
-        print(f"  Found {len(jobs)} Wellfound jobs")
+            jobs.append(JobRecord(
+                title=title.text(strip=True),
+                company=company.text(strip=True) if company else '',
+                location=location.text(strip=True) if location else '',
+                salary=salary.text(strip=True) if salary else '',
+                url=job_url,
+                source='wellfound'
+            ))
+        
+        logger.info("Found %d Wellfound jobs", len(jobs))
         return jobs
     
-    def scrape_flexjobs(self, keywords: str = "ai automation") -> List[Dict]:
+    def scrape_flexjobs(self, keywords: str = "ai automation") -> List[JobRecord]:
         """Scrape FlexJobs listings"""
-        print(f"\n💼 FlexJobs Search: {keywords}")
+        logger.info("FlexJobs Search: %s", keywords)
         
-        from urllib.parse import quote
-        url = f"https://www.flexjobs.com/search?search={quote(keywords)}"
-        html = self.client.get_content(url)
-        if not html:
+        html = self.client.get_content(self._flexjobs_url(keywords))
+        return self._parse_flexjobs(html)
+    
+    async def scrape_flexjobs_async(self, keywords: str = "ai automation") -> List[JobRecord]:
+        """Scrape FlexJobs listings without blocking the event loop"""
+        logger.info("FlexJobs Search: %s", keywords)
+        
+        html = await self.async_client.get_content(self._flexjobs_url(keywords))
+        return await _parse_off_loop(self._parse_flexjobs, html)
+    
+    @staticmethod
+    def _flexjobs_url(keywords: str) -> str:
+        """Build the FlexJobs search URL"""
+        return f"https://www.flexjobs.com/search?search={quote_plus(keywords)}"
+    
+    @staticmethod
+    def _parse_flexjobs(html: Optional[str]) -> List[JobRecord]:
+        """Extract FlexJobs listings from a rendered page"""
+        if not _has_markers(html, ('job-item', 'job-card', 'JobCard')):
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = parse_html(html)
         jobs = []
         
-        for listing in soup.select('.job-item, .job-card, [class*="JobCard"]')[:20]:
-            title = listing.select_one('.job-title, h2, h3')
-            company = listing.select_one('.company-name, .employer')
-            location = listing.select_one('.location, .job-location')
-            link = listing.select_one('a[href*="/job/"]')
+        for listing in tree.css('.job-item, .job-card, [class*="JobCard"]')[:20]:
+            title = listing.css_first('.job-title, h2, h3')
+            company = listing.css_first('.company-name, .employer')
+            location = listing.css_first('.location, .job-location')
+            link = listing.css_first('a[href*="/job/"]')
             
             if not title:
                 continue
             
-            jobs.append({
-                'title': title.get_text(strip=True),
-                'company': company.get_text(strip=True) if company else '',
-                'location': location.get_text(strip=True) if location else '',
-                'url': link.get('href', '') if link else '',
-                'source': 'flexjobs'
-            })
-        
-        print(f"  Found {len(jobs)} FlexJobs listings")
+            jobs.append(JobRecord(
+                title=title.text(strip=True),
+                company=company.text(strip=True) if company else '',
+                location=location.text(strip=True) if location else '',
+                url=(link.attributes.get('href') or '') if link else '',
+                source='flexjobs'
+            ))
+        
+        logger.info("Found %d FlexJobs listings", len(jobs))
         return jobs
 
 
 class BrowserlessStemCellScraper:
     """Scraper for stem cell/PRP centers using Browserless.io"""
     
-    def __init__(self, browserless: BrowserlessClient):
+    __slots__ = ('client', 'async_client')
+    
+    def __init__(self, browserless: BrowserlessClient,
+                 async_browserless: AsyncBrowserlessClient = None):
         self.client = browserless
+        self.async_client = async_browserless
     
     def search_closed_clinics(self, city: str, state: str = "TX") -> List[Dict]:
         """Search for closed stem cell/PRP clinics"""
-        print(f"\n🏥 Searching closed clinics in {city}, {state}")
+        logger.info("Searching closed clinics in %s, %s", city, state)
         
-        from urllib.parse import quote
-        
-        results = []
+        # The queries are independent, so render them concurrently; the
+        # client's rate limiter spaces out the Google requests
+        queries = self._search_queries(city, state)
+        pages = self.client.get_many_contents([self._search_url(query) for query in queries])
+        return self._parse_results(queries, pages, city)
+    
+    async def search_closed_clinics_async(self, city: str, state: str = "TX") -> List[Dict]:
+        """Search for closed stem cell/PRP clinics without blocking the event loop"""
+        logger.info("Searching closed clinics in %s, %s", city, state)
         
-        # Search Google for closed clinics
-        search_queries = [
+        queries = self._search_queries(city, state)
+        pages = await self.async_client.get_many_contents([self._search_url(query) for query in queries])
+        return await _parse_off_loop(self._parse_results, queries, pages, city)
+    
+    @staticmethod
+    def _search_queries(city: str, state: str) -> List[str]:
+        """Google searches for closed clinics"""
+        return [
             f"stem cell clinic closed {city} {state}",
             f"PRP center out of business {city} {state}",
             f"regenerative medicine clinic closed {city} Texas"
         ]
+    
+    @staticmethod
+    def _search_url(query: str) -> str:
+        """Build the Google search URL"""
+        return f"https://www.google.com/search?q={quote_plus(query)}"
+    
+    @staticmethod
+    def _parse_results(queries: List[str], pages: List[Optional[str]], city: str) -> List[Dict]:
+        """Parse the search result pages, one per query"""
+        results = []
         
-        for query in search_queries:
-            url = f"https://www.google.com/search?q={quote(query)}"
-            html = self.client.get_content(url)
+        for query, html in zip(queries, pages):
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = parse_html(html)
             
-            for result in soup.select('.g, [data-header-feature]')[:5]:
-                title = result.select_one('h3')
-                snippet = result.select_one('.VwiC3b, .IsZvec')
-                link = result.select_one('a')
+            for result in tree.css('.g, [data-header-feature]')[:5]:
+                title = result.css_first('h3')
+                snippet = result.css_first('.VwiC3b, .IsZvec')
+                link = result.css_first('a')
                 
                 if title:
                     results.append({
-                        'title': title.get_text(strip=True),
-                        'snippet': snippet.get_text(strip=True)[:200] if snippet else '',
-                        'url': link.get('href', '') if link else '',
+                        'title': title.text(strip=True),
+                        'snippet': snippet.text(strip=True)[:200] if snippet else '',
+                        'url': (link.attributes.get('href') or '') if link else '',
                         'query': query,
                         'city': city,
                         'source': 'google_search'
                     })
-            
-            time.sleep(1)  # Rate limiting
         
-        print(f"  Found {len(results)} potential results")
+        logger.info("Found %d potential results", len(results))
         return results
 
 
@@ -878,37 +2583,90 @@ class BrowserlessStemCellScraper:
 # UNIFIED SCRAPER SERVICE
 # ============================================
 
+# Max job sources scraped in parallel for one scrape_jobs() / scrape_jobs_async() call
+JOB_SOURCE_CONCURRENCY = int(os.environ.get('JOB_SOURCE_CONCURRENCY', '5'))
+
+
 class UnifiedScraperService:
     """
     Unified scraping service integrating all scrapers with Browserless.io
     Provides a single API for all scraping operations
     """
     
+    __slots__ = ('browserless', 'browserless_async', 'linkedin', 'indeed', 'spokeo',
+                 'instagram', 'jobs', 'stemcell')
+    
     def __init__(self, browserless_api_key: str = None):
-        print("\n" + "=" * 50)
-        print("INITIALIZING UNIFIED SCRAPER SERVICE")
-        print("=" * 50)
+        logger.info("Initializing unified scraper service")
         
         self.browserless = BrowserlessClient(browserless_api_key)
+        self.browserless_async = AsyncBrowserlessClient(browserless_api_key)
         
         # Initialize all scrapers
-        self.linkedin = BrowserlessLinkedInScraper(self.browserless)
-        self.indeed = BrowserlessIndeedScraper(self.browserless)
+        self.linkedin = BrowserlessLinkedInScraper(self.browserless, self.browserless_async)
+        self.indeed = BrowserlessIndeedScraper(self.browserless, self.browserless_async)
         self.spokeo = BrowserlessSpokeoScraper(self.browserless)
         self.instagram = BrowserlessInstagramScraper(self.browserless)
-        self.jobs = BrowserlessJobScraper(self.browserless)
-        self.stemcell = BrowserlessStemCellScraper(self.browserless)
+        self.jobs = BrowserlessJobScraper(self.browserless, self.browserless_async)
+        self.stemcell = BrowserlessStemCellScraper(self.browserless, self.browserless_async)
+        
+        logger.info("Scrapers initialized: LinkedIn, Indeed, Spokeo, Instagram, jobs, stem cell clinics")
+    
+    # Supported job sources, in the order results are reported
+    JOB_SOURCES = ('indeed', 'wellfound', 'remote_co', 'linkedin', 'flexjobs')
+    
+    def scrape_job_source(self, source: str, keywords: str, location: str = "",
+                          remote_only: bool = False) -> List[SourceRecord]:
+        """
+        Scrape jobs from a single platform
+        
+        Returns JobRecords, or ProfileRecords for 'linkedin'. Each source is
+        an independent Browserless round-trip, so callers can run several
+        of these concurrently.
+        """
+        if source == 'indeed':
+            return self.indeed.search_jobs(keywords, location, remote=remote_only)
+        
+        if source == 'wellfound':
+            role_slug = keywords.lower().replace(' ', '-')
+            return self.jobs.scrape_wellfound(role_slug)
+        
+        if source == 'remote_co':
+            category = keywords.lower().split()[0] if keywords else 'developer'
+            return self.jobs.scrape_remote_co(category)
+        
+        if source == 'linkedin':
+            return self.linkedin.search_profiles(keywords, location)
+        
+        if source == 'flexjobs':
+            return self.jobs.scrape_flexjobs(keywords)
+        
+        raise ValueError(f"Unknown job source: {source}")
+    
+    async def scrape_job_source_async(self, source: str, keywords: str, location: str = "",
+                                      remote_only: bool = False) -> List[SourceRecord]:
+        """Scrape jobs from a single platform without blocking the event loop"""
+        if source == 'indeed':
+            return await self.indeed.search_jobs_async(keywords, location, remote=remote_only)
+        
+        if source == 'wellfound':
+            role_slug = keywords.lower().replace(' ', '-')
+            return await self.jobs.scrape_wellfound_async(role_slug)
+        
+        if source == 'remote_co':
+            category = keywords.lower().split()[0] if keywords else 'developer'
+            return await self.jobs.scrape_remote_co_async(category)
+        
+        if source == 'linkedin':
+            return await self.linkedin.search_profiles_async(keywords, location)
         
-        print("\n✓ All scrapers initialized")
-        print("  - LinkedIn Scraper")
-        print("  - Indeed Scraper")
-        print("  - Spokeo Scraper")
-        print("  - Instagram Scraper")
-        print("  - Multi-Platform Job Scraper")
-        print("  - Stem Cell Clinic Scraper")
+        if source == 'flexjobs':
+            return await self.jobs.scrape_flexjobs_async(keywords)
+        
+        raise ValueError(f"Unknown job source: {source}")
     
     def scrape_jobs(self, keywords: str, location: str = "", 
-                   sources: List[str] = None, remote_only: bool = False) -> Dict[str, List]:
+                   sources: List[str] = None, remote_only: bool = False) -> Dict[str, List[SourceRecord]]:
         """
         Scrape jobs from multiple platforms
         
@@ -919,38 +2677,63 @@ class UnifiedScraperService:
             remote_only: Filter for remote jobs only
         
         Returns:
-            Dict mapping source names to job lists
+            Dict mapping source names to lists of JobRecord (ProfileRecord
+            for 'linkedin')
+        
+        Sources are fetched on a thread pool (at most JOB_SOURCE_CONCURRENCY
+        at once), so the call takes about as long as the slowest source.
         """
         if sources is None:
             sources = ['indeed', 'wellfound']
         
-        print(f"\n" + "=" * 50)
-        print(f"JOB SEARCH: {keywords}")
-        print(f"Location: {location or 'Any'}")
-        print(f"Sources: {', '.join(sources)}")
-        print("=" * 50)
+        logger.info("Job search: %s (location: %s, sources: %s)",
+                    keywords, location or 'Any', ', '.join(sources))
         
-        results = {}
+        def scrape_source(source: str) -> List[SourceRecord]:
+            try:
+                return self.scrape_job_source(source, keywords, location, remote_only)
+            except Exception as e:
+                logger.error("%s scrape failed: %s", source, e)
+                return []
         
-        if 'indeed' in sources:
-            results['indeed'] = self.indeed.search_jobs(keywords, location, remote=remote_only)
+        wanted = [source for source in self.JOB_SOURCES if source in sources]
+        with ThreadPoolExecutor(max_workers=max(1, min(JOB_SOURCE_CONCURRENCY, len(wanted)))) as pool:
+            results = dict(zip(wanted, pool.map(scrape_source, wanted)))
         
-        if 'wellfound' in sources:
-            role_slug = keywords.lower().replace(' ', '-')
-            results['wellfound'] = self.jobs.scrape_wellfound(role_slug)
+        total = sum(len(v) for v in results.values())
+        logger.info("Total jobs found: %d", total)
         
-        if 'remote_co' in sources:
-            category = keywords.lower().split()[0] if keywords else 'developer'
-            results['remote_co'] = self.jobs.scrape_remote_co(category)
+        return results
+    
+    async def scrape_jobs_async(self, keywords: str, location: str = "",
+                                sources: List[str] = None, remote_only: bool = False) -> Dict[str, List[SourceRecord]]:
+        """
+        Scrape jobs from multiple platforms concurrently
+        
+        Same arguments and result shape as scrape_jobs(), but every source is
+        fetched at once (at most JOB_SOURCE_CONCURRENCY in flight), so the
+        call takes as long as the slowest source rather than the sum.
+        """
+        if sources is None:
+            sources = ['indeed', 'wellfound']
+        
+        semaphore = asyncio.Semaphore(JOB_SOURCE_CONCURRENCY)
         
-        if 'linkedin' in sources:
-            results['linkedin'] = self.linkedin.search_profiles(keywords, location)
+        async def scrape_source(source: str):
+            async with semaphore:
+                try:
+                    jobs = await self.scrape_job_source_async(source, keywords, location, remote_only)
+                except Exception as e:
+                    # One broken source shouldn't discard the others' results
+                    logger.error("%s scrape failed: %s", source, e)
+                    jobs = []
+                return source, jobs
         
-        if 'flexjobs' in sources:
-            results['flexjobs'] = self.jobs.scrape_flexjobs(keywords)
+        wanted = [source for source in self.JOB_SOURCES if source in sources]
+        results = dict(await asyncio.gather(*(scrape_source(source) for source in wanted)))
         
         total = sum(len(v) for v in results.values())
-        print(f"\n✓ Total jobs found: {total}")
+        logger.info("Total jobs found: %d", total)
         
         return results
     
@@ -962,9 +2745,7 @@ class UnifiedScraperService:
         if sources is None:
             sources = ['spokeo']
         
-        print(f"\n" + "=" * 50)
-        print(f"PROPERTY SEARCH: {address}, {city}")
-        print("=" * 50)
+        logger.info("Property search: %s, %s", address, city)
         
         results = {}
         
@@ -988,10 +2769,7 @@ class UnifiedScraperService:
         if cities is None:
             cities = ['Austin', 'San Antonio', 'Houston']
         
-        print(f"\n" + "=" * 50)
-        print(f"CLOSED CLINIC SEARCH")
-        print(f"Cities: {', '.join(cities)}")
-        print("=" * 50)
+        logger.info("Closed clinic search: %s", ', '.join(cities))
         
         results = {}
         for city in cities:
@@ -999,42 +2777,113 @@ class UnifiedScraperService:
         
         return results
     
+    async def scrape_closed_clinics_async(self, cities: List[str] = None,
+                                          state: str = "TX") -> Dict[str, List]:
+        """
+        Scrape for closed stem cell/PRP clinics, all cities concurrently
+        
+        Same arguments and result shape as scrape_closed_clinics().
+        """
+        if cities is None:
+            cities = ['Austin', 'San Antonio', 'Houston']
+        
+        logger.info("Closed clinic search: %s", ', '.join(cities))
+        
+        found = await asyncio.gather(
+            *(self.stemcell.search_closed_clinics_async(city, state) for city in cities)
+        )
+        return dict(zip(cities, found))
+    
     def get_page_content(self, url: str, wait_for: str = None) -> Optional[str]:
         """Generic page content fetching with JS rendering"""
         return self.browserless.get_content(url, wait_for)
     
+    async def get_page_content_async(self, url: str, wait_for: str = None) -> Optional[str]:
+        """Generic page content fetching without blocking the event loop"""
+        return await self.browserless_async.get_content(url, wait_for)
+    
     def take_screenshot(self, url: str, full_page: bool = False) -> Optional[bytes]:
         """Take screenshot of any URL"""
         return self.browserless.get_screenshot(url, full_page)
     
+    async def take_screenshot_async(self, url: str, full_page: bool = False) -> Optional[bytes]:
+        """Take screenshot of any URL without blocking the event loop"""
+        return await self.browserless_async.get_screenshot(url, full_page)
+    
     def generate_pdf(self, url: str) -> Optional[bytes]:
         """Generate PDF from URL"""
         return self.browserless.get_pdf(url)
     
+    async def generate_pdf_async(self, url: str) -> Optional[bytes]:
+        """Generate PDF from URL without blocking the event loop"""
+        return await self.browserless_async.get_pdf(url)
+    
+    async def stream_screenshot_async(self, url: str, full_page: bool = False):
+        """Open a screenshot stream; the caller iterates and closes it"""
+        return await self.browserless_async.stream_screenshot(url, full_page)
+    
+    async def stream_pdf_async(self, url: str):
+        """Open a PDF stream; the caller iterates and closes it"""
+        return await self.browserless_async.stream_pdf(url)
+    
+    async def aclose(self):
+        """Release pooled connections held by the sync and async clients"""
+        await self.browserless_async.aclose()
+        self.browserless.close()
+    
     def export_results(self, results: Dict, filename: str = None) -> str:
         """Export results to CSV"""
-        import pandas as pd
+        import csv
         
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"scraper_results_{timestamp}.csv"
         
-        all_data = []
-        for source, items in results.items():
-            if isinstance(items, list):
-                for item in items:
-                    item['_source'] = source
-                    all_data.append(item)
-            elif isinstance(items, dict):
-                items['_source'] = source
-                all_data.append(items)
-        
-        if all_data:
-            df = pd.DataFrame(all_data)
-            df.to_csv(filename, index=False)
-            print(f"\n✓ Results exported to: {filename}")
+        # One pass collects the header (first-seen column order); the rows
+        # are then streamed to the file without being copied into a list
+        fieldnames = {}
+        for _, item in self._export_rows(results):
+            fieldnames.update(dict.fromkeys(item))
+            fieldnames['_source'] = None
+        
+        if fieldnames:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=list(fieldnames))
+                writer.writeheader()
+                for source, item in self._export_rows(results):
+                    writer.writerow({**item, '_source': source})
+            logger.info("Results exported to: %s", filename)
         
         return filename
+    
+    @staticmethod
+    def _export_rows(results: Dict) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yield (source, row) for every result dict or record in a results mapping
+        
+        Listings seen earlier under the same URL (query string dropped), title
+        and company - e.g. a job crossposted to Indeed and Wellfound - are
+        skipped. A 'name' counts as the title only for profiles with a
+        profile_url, so rows with neither a URL nor a title (Spokeo lookups)
+        are always kept.
+        """
+        seen = set()
+        for source, items in results.items():
+            if isinstance(items, dict):
+                items = [items]
+            elif not isinstance(items, list):
+                continue
+            for item in items:
+                row = asdict(item) if is_dataclass(item) else item
+                profile_url = row.get('profile_url')
+                url = str(row.get('url') or profile_url or '').split('?', 1)[0]
+                title = str(row.get('title') or (profile_url and row.get('name')) or '').lower()
+                if url or title:
+                    key = (url, title, str(row.get('company') or '').lower())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield source, row
 
 
 # ============================================
@@ -1054,6 +2903,8 @@ def get_scraper_service(api_key: str = None) -> UnifiedScraperService:
 
 def main():
     """Main execution for testing"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     print("\n" + "=" * 70)
     print("STORMBUSTER BROWSERLESS.IO INTEGRATION TEST")
     print("=" * 70)
@@ -1087,7 +2938,7 @@ def main():
     for source, job_list in jobs.items():
         print(f"\n{source.upper()}: {len(job_list)} jobs")
         for job in job_list[:3]:
-            print(f"  - {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
+            print(f"  - {job.title or 'N/A'} at {job.company or 'N/A'}")
     
     # Export results
     if any(jobs.values()):
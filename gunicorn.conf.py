@@ -0,0 +1,51 @@
+"""
+Gunicorn configuration for the model serving API
+
+Production entrypoint:
+    gunicorn -c gunicorn.conf.py api_server:app
+
+Runs one Uvicorn event loop per worker process, so JSON encoding and model
+inference spread across all cores instead of serializing onto one.
+"""
+
+import os
+
+
+def _cpu_count() -> int:
+    """Cores this process may run on (respects taskset/cpuset pinning)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Inference is CPU-bound, so default to one worker per core. Container CPU
+# limits are not visible here - set WEB_CONCURRENCY to match them
+workers = int(os.environ.get("WEB_CONCURRENCY", _cpu_count()))
+worker_connections = 1000
+keepalive = 30
+
+# Load the model after forking so each worker owns its own copy
+preload_app = False
+
+# Recycle workers now and then to cap slow memory growth
+max_requests = int(os.environ.get("MAX_REQUESTS", "10000"))
+max_requests_jitter = 1000
+graceful_timeout = 30
+timeout = 60
+
+# UvicornWorker picks uvloop and httptools automatically when installed.
+# Per-request access logging is off unless ACCESS_LOG is set
+accesslog = "-" if os.environ.get("ACCESS_LOG") else None
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges from the shared Prometheus directory"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -4,44 +4,152 @@ Demonstrates various scaling strategies
 """
 
 import asyncio
+import heapq
+import itertools
+import operator
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from typing import List, Dict, Any
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Hashable, Optional
 import numpy as np
 import pandas as pd
-from multiprocessing import Pool
+from joblib import Parallel, delayed
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# sklearn classifiers whose predict() is exactly classes_[argmax(predict_proba)].
+# Not true in general: SVC(probability=True) predicts from its decision
+# function, and thresholded or calibrated wrappers move the cut-off.
+_ARGMAX_CLASSIFIERS = frozenset({
+    'DecisionTreeClassifier',
+    'ExtraTreeClassifier',
+    'ExtraTreesClassifier',
+    'RandomForestClassifier',
+    'LogisticRegression',
+})
+
+
+def _predict_with_proba(model, X) -> tuple:
+    """
+    Class predictions and probabilities, from one predict_proba() pass when safe
+    
+    For the estimators in _ARGMAX_CLASSIFIERS the class is read off the
+    probabilities instead of running the model (e.g. walking every tree) a
+    second time; any other model gets its own predict().
+    """
+    model_type = type(model)
+    if not (model_type.__module__.startswith('sklearn.')
+            and model_type.__name__ in _ARGMAX_CLASSIFIERS
+            and np.ndim(getattr(model, 'classes_', None)) == 1):
+        return model.predict(X), model.predict_proba(X)
+    
+    probabilities = model.predict_proba(X)
+    best = probabilities.argmax(axis=1)
+    return model.classes_[best], probabilities
+
+
+class _FeatureSchema:
+    """Turns feature dicts into model input in the model's fit-time column order"""
+    
+    def __init__(self, model, dtype=np.float32):
+        self.dtype = dtype
+        self.columns = None
+        self.row_values = None
+        names = getattr(model, 'feature_names_in_', None)
+        # sklearn checks column names only for models fit on named features
+        self._named = names is not None
+        if self._named:
+            self._set_columns(list(names))
+    
+    def _set_columns(self, columns: List[str]) -> None:
+        self.columns = columns
+        # itemgetter does every dict lookup for a row in one C call
+        getter = operator.itemgetter(*columns)
+        self.row_values = getter if len(columns) > 1 else (lambda row: (getter(row),))
+    
+    def adopt(self, features: Dict[str, Any]) -> None:
+        """Take the column order from a request if the model records none"""
+        if self.columns is None:
+            self._set_columns(list(features))
+    
+    def frame(self, values: np.ndarray):
+        """Model input for a row-values array, named if the model expects names"""
+        if not self._named:
+            return values
+        return pd.DataFrame(values, columns=self.columns, copy=False)
+    
+    def __call__(self, rows: List[Dict[str, Any]]):
+        if self.columns is None:
+            # Unknown schema - fall back to DataFrame construction per call
+            return pd.DataFrame(rows)
+        return self.frame(np.array([self.row_values(row) for row in rows], dtype=self.dtype))
+
+
+def _even_bounds(n_rows: int, n_chunks: int) -> List[tuple]:
+    """(start, stop) row ranges split as np.array_split does, empty ranges dropped"""
+    size, extra = divmod(n_rows, n_chunks)
+    edges = np.cumsum([0] + [size + (i < extra) for i in range(n_chunks)])
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
 class DistributedDataProcessing:
     """Example: Distributed Data Processing"""
     
+    def __init__(self):
+        # Worker threads are started on first use and kept across calls
+        self._executor = None
+        self._executor_workers = 0
+    
+    def _pool(self, n_workers: int) -> ThreadPoolExecutor:
+        """Long-lived thread pool, rebuilt only when the worker count changes"""
+        if self._executor is None or self._executor_workers != n_workers:
+            self.close()
+            self._executor = ThreadPoolExecutor(max_workers=n_workers)
+            self._executor_workers = n_workers
+        return self._executor
+    
+    def close(self) -> None:
+        """Stop the worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     @staticmethod
     def process_chunk(chunk_data: pd.DataFrame) -> pd.DataFrame:
         """Process a chunk of data"""
-        # Simulate processing
-        processed = chunk_data.copy()
-        processed['processed'] = processed.sum(axis=1)
-        time.sleep(0.1)  # Simulate work
-        return processed
+        # Row sums as one float64 NumPy reduction over the numeric and bool
+        # columns; NaN and pd.NA are skipped as in DataFrame.sum
+        values = chunk_data.select_dtypes(include=['number', 'bool']).to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return chunk_data.assign(processed=np.nansum(values, axis=1))
     
     def process_parallel(self, data: pd.DataFrame, n_workers: int = 4) -> pd.DataFrame:
-        """Process data in parallel using multiprocessing"""
+        """Process data in parallel on a pool of worker threads"""
         logger.info(f"Processing data with {n_workers} workers")
         
-        # Split data into chunks
-        chunk_size = len(data) // n_workers
-        chunks = [data[i:i+chunk_size] for i in range(0, len(data), chunk_size)]
-        
-        # Process in parallel
-        with Pool(processes=n_workers) as pool:
-            results = pool.map(self.process_chunk, chunks)
+        bounds = _even_bounds(len(data), n_workers * 4)
+        if not bounds:
+            return self.process_chunk(data).reset_index(drop=True)
         
-        # Combine results
-        processed_data = pd.concat(results, ignore_index=True)
+        # Row slices share data's memory, so threads need no fork or
+        # pickling, and process_chunk's NumPy reduction releases the GIL.
+        # Several chunks per worker keep the cores busy when one is slow
+        chunks = [data.iloc[start:stop] for start, stop in bounds]
+        processed_data = pd.concat(
+            self._pool(n_workers).map(self.process_chunk, chunks), ignore_index=True
+        )
         logger.info(f"Processed {len(processed_data)} records")
         return processed_data
 
@@ -49,38 +157,98 @@ class DistributedDataProcessing:
 class AsyncModelServing:
     """Example: Async Model Serving for High Throughput"""
     
-    def __init__(self, model):
+    def __init__(self, model, max_batch_size: int = 32, max_wait_ms: float = 5):
         self.model = model
-        self.request_queue = asyncio.Queue()
+        self._to_input = _FeatureSchema(model)
+        # Requests arriving within max_wait_ms of each other are coalesced
+        # into one model call of up to max_batch_size rows
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        # Created on first use so they bind to the running event loop
+        self.request_queue = None
+        self._batcher_task = None
         self.results = {}
-        
+    
+    def _predict_rows(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """One vectorized model call for a list of feature dicts"""
+        return [int(p) for p in self.model.predict(self._to_input(rows))]
+    
     async def predict_async(self, request_id: str, features: Dict[str, Any]) -> Dict[str, Any]:
-        """Async prediction"""
-        # Simulate async processing
-        await asyncio.sleep(0.01)  # Simulate I/O
+        """Async prediction, batched with other requests in flight"""
+        if self._batcher_task is None or self._batcher_task.done():
+            self.request_queue = asyncio.Queue()
+            self._batcher_task = asyncio.create_task(self._batcher())
         
-        # Convert to DataFrame
-        df = pd.DataFrame([features])
-        
-        # Make prediction (this would be async in real implementation)
-        prediction = self.model.predict(df)[0]
+        future = asyncio.get_running_loop().create_future()
+        await self.request_queue.put((features, future))
+        prediction = await future
         
         return {
             'request_id': request_id,
-            'prediction': int(prediction),
+            'prediction': prediction,
             'timestamp': time.time()
         }
     
+    async def _batcher(self):
+        """Drain the request queue into batches and resolve each waiter"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self.request_queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.request_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Skip requests whose callers have already gone away
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+            
+            try:
+                predictions = await loop.run_in_executor(
+                    None, self._predict_rows, [features for features, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
+    
+    async def close(self):
+        """Stop the batching task"""
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+            self._batcher_task = None
+    
     async def batch_predict(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple requests concurrently"""
-        logger.info(f"Processing {len(requests)} requests concurrently")
+        """Score a known set of requests with a single model call"""
+        logger.info(f"Processing {len(requests)} requests as one batch")
         
-        tasks = [
-            self.predict_async(req['request_id'], req['features'])
-            for req in requests
-        ]
+        loop = asyncio.get_running_loop()
+        predictions = await loop.run_in_executor(
+            None, self._predict_rows, [req['features'] for req in requests]
+        )
         
-        results = await asyncio.gather(*tasks)
+        timestamp = time.time()
+        results = [
+            {'request_id': req['request_id'], 'prediction': prediction, 'timestamp': timestamp}
+            for req, prediction in zip(requests, predictions)
+        ]
         logger.info(f"Completed {len(results)} predictions")
         return results
 
@@ -90,22 +258,34 @@ class LoadBalancer:
     
     def __init__(self, model_instances: List[Any]):
         self.instances = model_instances
-        self.current_index = 0
+        # Replicas of one model share its feature schema
+        self._to_input = _FeatureSchema(model_instances[0]) if model_instances else None
+        self._cycle = itertools.cycle(range(len(model_instances)))
         self.request_counts = [0] * len(model_instances)
+        # (count, index) per instance; an entry can lag behind request_counts
+        # after round-robin picks and is refreshed when it reaches the top
+        self._least_loaded = [(0, i) for i in range(len(model_instances))]
+        self._lock = threading.Lock()
         
     def get_instance(self, strategy: str = 'round_robin') -> Any:
         """Get model instance based on load balancing strategy"""
         if strategy == 'round_robin':
-            instance = self.instances[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.instances)
-            self.request_counts[self.current_index] += 1
-            return instance
+            with self._lock:
+                index = next(self._cycle)
+                self.request_counts[index] += 1
+            return self.instances[index]
         
         elif strategy == 'least_connections':
-            # Return instance with least requests
-            min_index = self.request_counts.index(min(self.request_counts))
-            self.request_counts[min_index] += 1
-            return self.instances[min_index]
+            # Return instance with least requests (ties go to the lowest index)
+            with self._lock:
+                while True:
+                    count, index = heapq.heappop(self._least_loaded)
+                    if count == self.request_counts[index]:
+                        break
+                    heapq.heappush(self._least_loaded, (self.request_counts[index], index))
+                self.request_counts[index] += 1
+                heapq.heappush(self._least_loaded, (count + 1, index))
+            return self.instances[index]
         
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
@@ -113,57 +293,133 @@ class LoadBalancer:
     def predict(self, features: Dict[str, Any], strategy: str = 'round_robin') -> Dict[str, Any]:
         """Route prediction to appropriate instance"""
         instance = self.get_instance(strategy)
-        df = pd.DataFrame([features])
-        prediction = instance.predict(df)[0]
+        prediction = instance.predict(self._to_input([features]))[0]
         return {'prediction': int(prediction)}
 
 
+class CountMinSketch:
+    """Approximate request frequencies in fixed memory (TinyLFU admission)"""
+    
+    def __init__(self, depth: int = 4, width: int = 1024, sample_size: int = 10000):
+        self.width = width
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+        self._rows = np.arange(depth)
+        self._seeds = tuple(range(depth))
+        # Counters are halved every sample_size additions so old traffic fades
+        self.sample_size = sample_size
+        self._additions = 0
+    
+    def _index(self, key: Hashable) -> np.ndarray:
+        return np.array([hash((seed, key)) % self.width for seed in self._seeds])
+    
+    def add(self, key: Hashable) -> None:
+        """Count one occurrence of key"""
+        self.table[self._rows, self._index(key)] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self.table >>= 1
+            self._additions //= 2
+    
+    def estimate(self, key: Hashable) -> int:
+        """Upper-bound estimate of how often key was seen recently"""
+        return int(self.table[self._rows, self._index(key)].min())
+
+
 class CachingLayer:
     """Example: Caching Layer for Model Predictions"""
     
-    def __init__(self, model, cache_size: int = 1000):
+    def __init__(self, model, cache_size: int = 1000, admission: bool = True):
         self.model = model
-        self.cache = {}
+        self._to_input = _FeatureSchema(model)
+        self.cache = OrderedDict()
         self.cache_size = cache_size
         self.hits = 0
         self.misses = 0
-        
-    def _hash_features(self, features: Dict[str, Any]) -> str:
-        """Create hash key from features"""
-        import hashlib
-        feature_str = str(sorted(features.items()))
-        return hashlib.md5(feature_str.encode()).hexdigest()
+        self.rejected = 0
+        self.coalesced = 0
+        # Misses being computed, by key; concurrent callers for the same key
+        # wait on the first one's Future instead of running the model again
+        self._inflight = {}
+        self._lock = threading.Lock()
+        # When full, a new entry only replaces the LRU victim if it has been
+        # requested more often, so one-off requests don't flush hot entries
+        self.sketch = CountMinSketch(
+            width=max(1024, 4 * cache_size), sample_size=10 * cache_size
+        ) if admission else None
+        
+    def _cache_key(self, features: Dict[str, Any]) -> Hashable:
+        """Create cache key from features (order-independent)"""
+        # The sorted items tuple is the key itself; dict lookups hash it
+        # natively, so no string building or digest per request
+        key = tuple(sorted(features.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable feature values (lists, arrays) fall back to their repr
+            return repr(key)
+        return key
     
     def predict(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Predict with caching"""
-        cache_key = self._hash_features(features)
-        
-        # Check cache
-        if cache_key in self.cache:
-            self.hits += 1
-            logger.debug("Cache hit")
-            return self.cache[cache_key]
-        
-        # Cache miss - compute prediction
-        self.misses += 1
-        df = pd.DataFrame([features])
-        prediction = self.model.predict(df)[0]
-        probability = self.model.predict_proba(df)[0].tolist()
+        cache_key = self._cache_key(features)
+        # Set only when this call computes the result for its key
+        future = None
+        
+        with self._lock:
+            if self.sketch is not None:
+                self.sketch.add(cache_key)
+            
+            # Check cache; a hit becomes the most recently used entry
+            if cache_key in self.cache:
+                self.hits += 1
+                logger.debug("Cache hit")
+                self.cache.move_to_end(cache_key)
+                return self.cache[cache_key]
+            
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                self.misses += 1
+                future = self._inflight[cache_key] = Future()
+            else:
+                self.hits += 1
+                self.coalesced += 1
+        
+        if future is None:
+            return pending.result()
+        
+        # Cache miss - compute prediction outside the lock
+        try:
+            predictions, probabilities = _predict_with_proba(self.model, self._to_input([features]))
+        except Exception as e:
+            with self._lock:
+                del self._inflight[cache_key]
+            future.set_exception(e)
+            raise
         
         result = {
-            'prediction': int(prediction),
-            'probability': probability
+            'prediction': int(predictions[0]),
+            'probability': probabilities[0].tolist()
         }
         
-        # Add to cache (with LRU eviction if needed)
-        if len(self.cache) >= self.cache_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
+        with self._lock:
+            del self._inflight[cache_key]
+            self._store(cache_key, result)
+        future.set_result(result)
         
-        self.cache[cache_key] = result
         return result
     
+    def _store(self, cache_key: Hashable, result: Dict[str, Any]) -> None:
+        """Add to cache, evicting the least recently used entries"""
+        if self.sketch is not None and len(self.cache) >= self.cache_size:
+            victim = next(iter(self.cache))
+            if self.sketch.estimate(cache_key) <= self.sketch.estimate(victim):
+                self.rejected += 1
+                return
+        
+        self.cache[cache_key] = result
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total = self.hits + self.misses
@@ -173,6 +429,8 @@ class CachingLayer:
             'cache_size': len(self.cache),
             'hits': self.hits,
             'misses': self.misses,
+            'rejected': self.rejected,
+            'coalesced': self.coalesced,
             'hit_rate': hit_rate
         }
 
@@ -180,45 +438,133 @@ class CachingLayer:
 class BatchProcessor:
     """Example: Batch Processing for Efficient Inference"""
     
-    def __init__(self, model, batch_size: int = 32, max_wait_time: float = 0.1):
+    def __init__(self, model, batch_size: int = 32, max_wait_time: float = 0.1,
+                 dtype=np.float32, target_latency_ms: Optional[float] = None,
+                 adjust_every: int = 20):
         self.model = model
         self.batch_size = batch_size
+        self.max_batch_size = batch_size
         self.max_wait_time = max_wait_time
-        self.batch_queue = []
-        self.last_batch_time = time.time()
-        
-    def add_request(self, features: Dict[str, Any]) -> None:
-        """Add request to batch queue"""
-        self.batch_queue.append(features)
-        
-        # Process batch if full or timeout
-        should_process = (
-            len(self.batch_queue) >= self.batch_size or
-            (time.time() - self.last_batch_time) >= self.max_wait_time
-        )
-        
-        if should_process and self.batch_queue:
-            self._process_batch()
+        # With a latency target, batch_size follows AIMD: halved when the P99
+        # model call time over the last adjust_every batches exceeds it,
+        # grown by 4 (up to the initial size) when it stays under
+        self.target_latency_ms = target_latency_ms
+        self._durations = deque(maxlen=adjust_every)
+        # (row values in the cached column order, Future) per queued request
+        self.batch_queue = queue.Queue()
+        # Column order comes from the model, or else from the first request
+        self._schema = _FeatureSchema(model, dtype)
+        self._buf = None
+        self._closed = False
+        # Guards the closed flag and the lazy schema/buffer setup
+        self._lock = threading.Lock()
+        # Inference runs on this thread, so callers only pay for the enqueue
+        self._worker = threading.Thread(target=self._loop, name="batch-processor", daemon=True)
+        self._worker.start()
+        
+    def add_request(self, features: Dict[str, Any]) -> Future:
+        """
+        Add request to batch queue
+        
+        Returns a Future resolving to (prediction, probabilities) once the
+        request's batch has been scored.
+        """
+        future = Future()
+        with self._lock:
+            # Nothing would ever score a request queued after the stop marker
+            if self._closed:
+                raise RuntimeError("BatchProcessor is closed")
+            # The first request fixes the column order, so concurrent first
+            # callers must not each adopt their own
+            if self._buf is None:
+                self._schema.adopt(features)
+                self._buf = np.empty((self.max_batch_size, len(self._schema.columns)),
+                                     dtype=self._schema.dtype)
+            self.batch_queue.put((self._schema.row_values(features), future))
+        return future
+    
+    def close(self) -> None:
+        """Score whatever is queued, then stop the worker thread"""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self.batch_queue.put(None)
+        self._worker.join()
+    
+    def __enter__(self):
+        return self
     
-    def _process_batch(self):
-        """Process current batch"""
-        if not self.batch_queue:
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _loop(self):
+        """Collect batches of up to batch_size, or whatever arrives within max_wait_time"""
+        while True:
+            item = self.batch_queue.get()
+            if item is None:
+                return
+            
+            # The wait is measured from the oldest request in the batch
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait_time
+            stopping = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self.batch_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._process_batch(batch)
+            if stopping:
+                return
+    
+    def _process_batch(self, batch: List[tuple]):
+        """Score one batch and resolve each request's future"""
+        # Fill the preallocated buffer in one bulk assignment
+        rows = self._buf[:len(batch)]
+        start = time.perf_counter_ns()
+        try:
+            rows[:] = [values for values, _ in batch]
+            df = self._schema.frame(rows)
+            
+            # Batch prediction
+            predictions, probabilities = _predict_with_proba(self.model, df)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
             return
+        if self.target_latency_ms is not None:
+            self._adjust_batch_size((time.perf_counter_ns() - start) / 1e6)
         
-        batch = self.batch_queue[:self.batch_size]
-        self.batch_queue = self.batch_queue[self.batch_size:]
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(batch)
-        
-        # Batch prediction
-        predictions = self.model.predict(df)
-        probabilities = self.model.predict_proba(df)
+        for (_, future), prediction, probability in zip(batch, predictions, probabilities):
+            future.set_result((prediction, probability))
         
         logger.info(f"Processed batch of {len(batch)} requests")
-        self.last_batch_time = time.time()
+    
+    def _adjust_batch_size(self, duration_ms: float) -> None:
+        """Shrink or grow batch_size once a full window of timings is in"""
+        self._durations.append(duration_ms)
+        if len(self._durations) < self._durations.maxlen:
+            return
+        
+        p99 = np.percentile(self._durations, 99)
+        if p99 > self.target_latency_ms:
+            new_size = max(1, self.batch_size // 2)
+        else:
+            new_size = min(self.max_batch_size, self.batch_size + 4)
         
-        return predictions, probabilities
+        if new_size != self.batch_size:
+            logger.debug(f"Batch size {self.batch_size} -> {new_size} (P99 {p99:.2f} ms)")
+            self.batch_size = new_size
+        # Judge the next size on its own timings
+        self._durations.clear()
 
 
 class AutoScaler:
@@ -278,7 +624,8 @@ class DistributedTraining:
         X_chunk, y_chunk = chunk_data
         
         from sklearn.ensemble import RandomForestClassifier
-        model = RandomForestClassifier(n_estimators=50, random_state=42)
+        # One core per fit; the parallelism is across chunks
+        model = RandomForestClassifier(n_estimators=50, random_state=42, n_jobs=1)
         model.fit(X_chunk, y_chunk)
         
         return {
@@ -288,25 +635,41 @@ class DistributedTraining:
     
     def train_distributed(self, X: pd.DataFrame, y: pd.Series, 
                          n_workers: int = 4) -> Any:
-        """Train model using distributed approach"""
+        """
+        Train model using distributed approach
+        
+        Returns a single RandomForestClassifier holding every chunk's trees.
+        """
         logger.info(f"Training with {n_workers} workers")
         
-        # Split data
-        chunk_size = len(X) // n_workers
+        # Split data, two chunks per worker so one slow fit doesn't hold
+        # up the whole pool. Rows are dealt out in label order so every chunk
+        # sees every class, which merging the forests below relies on
+        n_chunks = n_workers * 2
+        order = np.argsort(np.asarray(y), kind='stable')
         chunks = [
-            (X[i:i+chunk_size], y[i:i+chunk_size])
-            for i in range(0, len(X), chunk_size)
+            (X.iloc[order[i::n_chunks]], y.iloc[order[i::n_chunks]])
+            for i in range(min(n_chunks, len(order)))
         ]
         
-        # Train on each chunk
-        with Pool(processes=n_workers) as pool:
-            results = pool.map(self.train_on_chunk, chunks)
-        
-        # Aggregate models (simple voting ensemble)
-        models = [r['model'] for r in results]
-        logger.info(f"Trained {len(models)} models")
+        # Fits hold the GIL, so they run in processes; loky keeps its workers
+        # alive between calls instead of forking a new pool each time
+        results = Parallel(n_jobs=n_workers, backend='loky')(
+            delayed(self.train_on_chunk)(chunk) for chunk in chunks
+        )
         
-        return models
+        # Merge the trees into one forest: predict_proba then averages every
+        # tree in one call instead of a Python-level vote over models
+        forest = results[0]['model']
+        for r in results[1:]:
+            if not np.array_equal(r['model'].classes_, forest.classes_):
+                raise ValueError(f"Every class needs at least {len(chunks)} samples to merge the chunk forests")
+            forest.estimators_ += r['model'].estimators_
+        forest.n_estimators = len(forest.estimators_)
+        forest.n_jobs = -1
+        logger.info(f"Trained {len(results)} models ({forest.n_estimators} trees)")
+        
+        return forest
 
 
 # Example usage
@@ -316,7 +679,9 @@ if __name__ == "__main__":
     
     # Generate sample data
     X, y = make_classification(n_samples=1000, n_features=10, random_state=42)
-    X_df = pd.DataFrame(X)
+    # Named float32 columns: the model records its feature order, so serving
+    # builds float32 arrays directly, and tree fitting skips its own cast
+    X_df = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(X.shape[1])]).astype(np.float32)
     y_series = pd.Series(y)
     
     # Train a simple model
@@ -329,8 +694,8 @@ if __name__ == "__main__":
     
     # Example 1: Distributed Processing
     print("\n1. Distributed Data Processing")
-    processor = DistributedDataProcessing()
-    processed = processor.process_parallel(X_df, n_workers=4)
+    with DistributedDataProcessing() as processor:
+        processed = processor.process_parallel(X_df, n_workers=4)
     
     # Example 2: Caching
     print("\n2. Caching Layer")